@@ -11,4 +11,8 @@
 :Authors:
     - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
 """
-from .aiovalidator import Validator, ValidationError
+from .aiovalidator import Validator, ValidationError, ValidationTimeout, Issues
+from .files import UploadedFile
+from .lazy import LazyObject
+from .records import Record
+from .schema import Schema
@@ -11,25 +11,171 @@
 :Authors:
     - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
 """
-from collections import Mapping, Sequence
+from collections.abc import Mapping, Sequence
 from datetime import datetime
-from asyncio import iscoroutinefunction
+from asyncio import TimeoutError as AsyncTimeoutError, gather, get_event_loop, iscoroutinefunction, wait_for
+from copy import copy
+from time import monotonic
+from inspect import isfunction
+from array import array
+from functools import partial
+from json import JSONDecodeError, loads
+from operator import gt, lt
+from sys import getrecursionlimit
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
+import hashlib
 import re
 
-__all__ = ['Validator', 'ValidationError']
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .patch import PatchError, apply_patch, parse_pointer
+from .records import Record, make_record_class
+from .batch import BatchLoader
+from .formats import FORMATS
+from .files import SNIFF_SIZE, UploadedFile, is_chunked, iter_chunks, sniff_content_type
+
+__all__ = ['Validator', 'ValidationError', 'ValidationTimeout', 'Issues']
+
+
+class Issues:
+    """
+    Issues of a container value, stored as a flat list of `(path, message)` records.
+
+    Nested issues are merged into their container by prefixing their paths, the nested dict shape is only built on
+    demand by `to_dict`.
+
+    Parameters
+    ----------
+    records : list, optional
+        Records, each one is a tuple of the path (a tuple of keys and indexes) and the error message.
+    truncated : bool, optional
+        Whether the validation has been stopped after too many issues, so some issues are missing.
+    """
+    __slots__ = ('records', 'truncated')
+
+    def __init__(self, records: list = None, truncated: bool = False):
+        self.records = [] if records is None else records
+        self.truncated = truncated
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __repr__(self):
+        return 'Issues({0!r}, truncated={1!r})'.format(self.records, self.truncated)
+
+    def add(self, path: tuple, msg: str):
+        """
+        Adds an issue at the path.
+        """
+        self.records.append((path, msg))
+
+    def extend(self, path: tuple, error: 'ValidationError'):
+        """
+        Adds the issues of the error raised by a nested value at the path.
+        """
+        issues = error.records
+        if issues is None:
+            self.records.append((path, error.msg))
+        else:
+            self.records.extend((path + nested_path, msg) for nested_path, msg in issues.records)
+            self.truncated = self.truncated or issues.truncated
+
+    def truncate(self, limit: int):
+        """
+        Keeps the first `limit` issues and marks the issues as truncated.
+        """
+        del self.records[limit:]
+        self.truncated = True
+
+    def to_dict(self) -> dict:
+        """
+        Returns the issues as nested dicts keyed by object keys and array indexes.
+        """
+        result = {}
+        for path, msg in self.records:
+            issues = result
+            for key in path[:-1]:
+                nested = issues.get(key)
+                if not isinstance(nested, dict):
+                    nested = issues[key] = {}
+                issues = nested
+            issues[path[-1]] = msg
+
+        return result
+
+    @classmethod
+    def from_dict(cls, issues: dict) -> 'Issues':
+        """
+        Returns the issues, given as nested dicts.
+        """
+        records = []
+        stack = [((), issues)]
+        while stack:
+            path, nested = stack.pop()
+            for key, issue in nested.items():
+                if isinstance(issue, dict):
+                    stack.append((path + (key,), issue))
+                else:
+                    records.append((path + (key,), issue))
+
+        return cls(records)
 
 
 class ValidationError(ValueError):
     """
     Parameters
     ----------
-    ...
+    msg : str
+        ...
+    issues : Issues, dict, optional
+        Issues of the nested values, flat or as nested dicts.
     """
     def __init__(self, msg: str, issues=None):
         self.msg = msg
+        self._records = None
+        self._issues = None
         self.issues = issues
         super().__init__(msg)
 
+    @property
+    def records(self) -> Issues:
+        """
+        Issues of the nested values as flat records.
+        """
+        if self._records is None and self._issues is not None:
+            self._records = Issues.from_dict(self._issues)
+        return self._records
+
+    @property
+    def truncated(self) -> bool:
+        """
+        Whether the validation has been stopped after too many issues, so some issues are missing.
+        """
+        return self.records is not None and self.records.truncated
+
+    @property
+    def issues(self) -> dict:
+        """
+        Issues of the nested values as nested dicts.
+        """
+        if self._issues is None and self._records is not None:
+            self._issues = self._records.to_dict()
+        return self._issues
+
+    @issues.setter
+    def issues(self, issues):
+        if isinstance(issues, Issues):
+            self._records, self._issues = issues, None
+        else:
+            self._records, self._issues = None, issues
+
     # def __str__(self):
     #     return self._msg
 
@@ -37,9 +183,402 @@ class ValidationError(ValueError):
     #     return iter(self._msg.items())
 
 
+class ValidationTimeout(TimeoutError):
+    """
+    Parameters
+    ----------
+    timeout : float
+        Time budget of the validation, in seconds.
+    path : tuple, optional
+        Path of the value, which was being validated when the deadline expired.
+    """
+    def __init__(self, timeout: float, path: tuple = ()):
+        self.timeout = timeout
+        self.path = path
+        super().__init__(timeout)
+
+    def __str__(self):
+        return "validation has timed out after {0}s at '/{1}'".format(self.timeout, '/'.join(map(str, self.path)))
+
+
+# Kinds of the `struct` format characters, as in `numpy.dtype.kind`.
+_FORMAT_KINDS = dict.fromkeys('bhilqn', 'i')
+_FORMAT_KINDS.update(dict.fromkeys('BHILQN', 'u'))
+_FORMAT_KINDS.update(dict.fromkeys('efd', 'f'))
+_FORMAT_KINDS['?'] = 'b'
+
+
+# Marks a missing key, where `None` is a valid value.
+_MISSING = object()
+
+
+# JSON types of the Python types, which are produced by JSON decoders, the subclasses and ABCs are not included.
+JSON_TYPES = {
+    dict: 'object',
+    list: 'array',
+    tuple: 'array',
+    str: 'string',
+    int: 'integer',
+    float: 'float',
+    bool: 'boolean',
+    type(None): 'null',
+}
+
+
+def _json_type(value) -> str:
+    """
+    Returns the JSON type of a value, by an exact type lookup for the common types and by `isinstance` checks for
+    the others.
+
+    Returns
+    -------
+    str
+        `object`, `array`, `string`, `integer`, `float`, `boolean`, `null`, `buffer` (typed buffers) or `None`.
+    """
+    try:
+        return JSON_TYPES[type(value)]
+    except KeyError:
+        pass
+
+    # bool is a subclass of int
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'float'
+    if isinstance(value, str):
+        return 'string'
+    if _is_buffer(value):
+        return 'buffer'
+    if isinstance(value, Mapping):
+        return 'object'
+    if isinstance(value, Sequence):
+        return 'array'
+
+    return None
+
+
+def _is_buffer(value) -> bool:
+    """
+    Checks if the value is a typed buffer, i.e. a NumPy array, an `array.array` or a `memoryview`.
+    """
+    if isinstance(value, (array, memoryview)):
+        return True
+
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def _buffer_dtype(value) -> tuple:
+    """
+    Returns the kind (as in `numpy.dtype.kind`) and the item size of a typed buffer.
+    """
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        return value.dtype.kind, value.dtype.itemsize
+
+    with memoryview(value) as view:
+        return _FORMAT_KINDS.get(view.format.lstrip('@=<>!'), ''), view.itemsize
+
+
+def _check_numbers(values, min_value=None, max_value=None, allowed=None) -> bool:
+    """
+    Checks in bulk that all the numbers are within the bounds and the allowed values.
+
+    Uses NumPy when it is installed and the values are a typed buffer or a homogeneous list, which fits into a native
+    dtype without a loss of precision, builtin functions otherwise.
+
+    Parameters
+    ----------
+    values : sequence
+        Numbers, to be checked.
+    min_value : int, float, optional
+        ...
+    max_value : int, float, optional
+        ...
+    allowed : list, optional
+        ...
+
+    Returns
+    -------
+    bool
+    """
+    if numpy is not None:
+        try:
+            array = _numeric_array(values, min_value, max_value)
+            if array is not None:
+                if min_value is not None and (array < min_value).any():
+                    return False
+                if max_value is not None and (array > max_value).any():
+                    return False
+                min_value = max_value = None
+        except (OverflowError, TypeError, ValueError):
+            pass
+
+    # NaN compares false with everything, so `min()`/`max()` could hide an out of bounds value.
+    if min_value is not None and any(map(partial(gt, min_value), values)):
+        return False
+
+    if max_value is not None and any(map(partial(lt, max_value), values)):
+        return False
+
+    if allowed is not None:
+        try:
+            if not set(values) <= set(allowed):
+                return False
+        except TypeError:
+            return False
+
+    return True
+
+
+def _numeric_array(values, min_value=None, max_value=None):
+    """
+    Returns a NumPy array of the numbers, which compares with the bounds exactly as the numbers themselves, or `None`.
+
+    Mixed integers and floats would be upcast to float64 and integers compared with a float bound would be converted
+    to float64, so both lose precision. Floats are compared in float64, since NumPy compares a float32 array with
+    a Python float in float32.
+    """
+    if _is_buffer(values):
+        array = numpy.asarray(values)
+    else:
+        types = set(map(type, values))
+        if types == {int}:
+            array = numpy.asarray(values, dtype=numpy.int64)
+        elif types == {float}:
+            array = numpy.asarray(values, dtype=numpy.float64)
+        else:
+            return None
+
+    kind = array.dtype.kind
+    if kind == 'f':
+        return array.astype(numpy.float64, copy=False)
+    if kind in 'iu' and not isinstance(min_value, float) and not isinstance(max_value, float):
+        return array
+    return None
+
+
+def _unchanged(mapping, items: tuple) -> bool:
+    """
+    Checks if the mapping still has the same items, compared by identity.
+    """
+    return len(mapping) == len(items) and all(mapping.get(key, _MISSING) is item for key, item in items)
+
+
+def _freeze(value):
+    """
+    Returns a hashable equivalent of the value: lists become tuples, objects, records and sets become frozen sets.
+    Booleans are tagged with their type, so that they are not equal to `1` and `0`.
+    """
+    if isinstance(value, (str, bytes)):
+        return value
+
+    if isinstance(value, bool):
+        return bool, value
+
+    if isinstance(value, Record):
+        return _freeze(value.to_dict())
+
+    if isinstance(value, Mapping):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+
+    if isinstance(value, (Sequence, array, memoryview)):
+        return tuple(map(_freeze, value))
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(_freeze, value))
+
+    return value
+
+
+class _UniqueIndexes:
+    """
+    Hash indexes of the array items, which check the uniqueness of each item as it is added.
+
+    Parameters
+    ----------
+    indexes : list
+        Indexes, each one is a property name, a list of property names or an empty list for the whole item.
+    """
+    __slots__ = ('_keys', '_seen')
+
+    def __init__(self, indexes: list):
+        self._keys = [(index,) if isinstance(index, str) else tuple(index) for index in indexes]
+        self._seen = [{} for _ in self._keys]
+
+    def add(self, i: int, item):
+        """
+        Indexes the item.
+
+        Returns
+        -------
+        int, None
+            The position of the first item with the same index value, if any.
+        """
+        for keys, seen in zip(self._keys, self._seen):
+            if not keys:
+                key = item
+            elif isinstance(item, Mapping):
+                key = tuple(item.get(k) for k in keys)
+                if None in key:
+                    continue
+            elif isinstance(item, Record):
+                key = tuple(getattr(item, k, None) for k in keys)
+                if None in key:
+                    continue
+            else:
+                continue
+
+            if key is None:
+                continue
+
+            # Strings and numbers are keys as is, the rest is frozen, which also separates the booleans.
+            if type(key) not in (str, int, float):
+                key = _freeze(key)
+            j = seen.setdefault(key, i)
+
+            if j != i:
+                return j
+
+        return None
+
+    def find_duplicates(self, items):
+        """
+        Indexes all the items, yields the positions of duplicates along with the positions of their first items.
+        """
+        # Whole item indexes of hashable scalars are checked in bulk first.
+        if all(not keys for keys in self._keys):
+            try:
+                if len(set(items)) == len(items):
+                    return
+            except TypeError:
+                pass
+
+        for i, item in enumerate(items):
+            j = self.add(i, item)
+            if j is not None:
+                yield i, j
+
+
+class _ObjectKeys:
+    """
+    Key sets of the object properties, which are computed once per properties dict, so that missing and unknown keys
+    are found by set differences against the object keys.
+
+    Parameters
+    ----------
+    properties : dict
+        Object properties, the keys of the form `^...$` are regular expressions.
+    """
+    __slots__ = ('properties', 'patterns', 'names', 'required', 'defaults', 'batched')
+
+    def __init__(self, properties: dict):
+        # Named properties and all the properties along with their compiled regular expressions, keeping their order.
+        self.properties = {}
+        self.patterns = []
+        for prop, validator_params in properties.items():
+            if prop.startswith('^') and prop.endswith('$'):
+                self.patterns.append((prop, re.compile(prop), validator_params))
+            else:
+                self.properties[prop] = validator_params
+                self.patterns.append((prop, None, validator_params))
+        if len(self.patterns) == len(self.properties):
+            self.patterns = None
+
+        self.names = frozenset(self.properties)
+        self.required = frozenset(
+            prop for prop, validator_params in self.properties.items() if validator_params.get('required', True) is True
+        )
+        self.defaults = {
+            prop: validator_params['default'] for prop, validator_params in self.properties.items()
+            if prop not in self.required and 'default' in validator_params
+        }
+
+        # Whether any property has a batched type, it is set by the validator.
+        self.batched = False
+
+    def expand(self, value, unknown: set) -> dict:
+        """
+        Returns the properties of an object, where the regular expression properties are replaced with the unknown
+        object keys they match.
+        """
+        extra = [key for key in value.keys() if key in unknown]
+        _properties = {}
+        for prop, pattern, validator_params in self.patterns:
+            if pattern is None:
+                _properties[prop] = validator_params
+            else:
+                for key in extra:
+                    if pattern.fullmatch(key):
+                        _properties[key] = validator_params
+
+        return _properties
+
+
+async def _gather(coroutines) -> list:
+    """
+    Runs the coroutines concurrently and returns their results, validation errors are returned in place of the values
+    and any other exception is raised.
+    """
+    results = await gather(*coroutines, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, (ValidationError, ValidationTimeout)):
+            raise result
+
+    return results
+
+
+def _result(result):
+    """
+    Returns a result of `_gather` or raises the validation error in its place.
+    """
+    if isinstance(result, (ValidationError, ValidationTimeout)):
+        raise result
+
+    return result
+
+
+# Type tuples of the `validate_<type>` methods, they are shared by the subclasses, so that a type, which is not
+# overridden, is the same object as of `Validator`, e.g. for the bulk checks.
+_METHOD_TYPES = WeakKeyDictionary()
+
+
+def _method_types(namespace: dict) -> dict:
+    """
+    Returns the types defined by the `validate_<type>` methods of a class namespace.
+    """
+    types = {}
+    for name, func in namespace.items():
+        if name.startswith('validate_') and isfunction(func):
+            type_ = _METHOD_TYPES.get(func)
+            if type_ is None:
+                type_ = _METHOD_TYPES[func] = (func, iscoroutinefunction(func), None)
+            types[name[len('validate_'):]] = type_
+
+    return types
+
+
+def _resolve_types(cls) -> dict:
+    """
+    Returns the types of a class along its MRO: the `validate_<type>` methods and the registered types of each class,
+    including the mixins, override the ones of its bases.
+    """
+    types = {}
+    for klass in reversed(cls.__mro__):
+        types.update(_method_types(vars(klass)))
+        types.update(vars(klass).get('_registered_types', {}))
+
+    return types
+
+
 class Validator:
     """
     """
+    # Types by name, each one is a tuple of the validate function, which takes the validator as the first argument,
+    # whether it is a coroutine function and the batch function. It is resolved along the MRO from `validate_<type>`
+    # methods and the types registered by `register_type`, which are kept by each class in `_registered_types`.
+    _types = {}
+
     ERROR_BAD_TYPE = "must be of '{0}' type"
     ERROR_NOT_NULLABLE = "null value not allowed"
     ERROR_UNKNOWN_FIELD = "unknown field"
@@ -51,6 +590,11 @@ class Validator:
     ERROR_STR_MIN_LENGTH = "minimum length of the string is '{0}' characters"
     ERROR_STR_MAX_LENGTH = "maximum length of the string is '{0}' characters"
     ERROR_STR_REGEX = "value does not match regex '{0}'"
+    ERROR_STR_FORMAT = "value is not a valid '{0}'"
+    ERROR_BYTES_MIN_LENGTH = "minimum length of the bytes is '{0}'"
+    ERROR_BYTES_MAX_LENGTH = "maximum length of the bytes is '{0}'"
+    ERROR_BYTES_ENCODING = "value is not valid '{0}'"
+    ERROR_BAD_JSON = "invalid JSON"
 
     ERROR_MIN_LENGTH = "min length is '{0}'"
     ERROR_MAX_LENGTH = "max length is '{0}'"
@@ -61,11 +605,158 @@ class Validator:
     ERROR_MAX_VALUE = "max value is '{0}'"
 
     ERROR_UNALLOWED_VALUES = "unallowed values {0}"
+    ERROR_NOT_UNIQUE = "duplicate of item '{0}'"
+
+    ERROR_MAX_DEPTH = "maximum depth is '{0}'"
+    ERROR_MAX_NODES = "maximum number of values is '{0}'"
+    ERROR_MAX_KEYS = "maximum number of keys is '{0}'"
+
+    ERROR_FILE_MAX_SIZE = "maximum size of the file is '{0}' bytes"
+    ERROR_FILE_CONTENT_TYPE = "unallowed content type '{0}'"
+
+    # Maximum number of the entries in the caches of the per schema data.
+    MAX_CACHE_SIZE = 512
+
+    # Value of `allow_unknown`, which drops the unknown keys of the objects.
+    STRIP_UNKNOWN = 'strip'
+
+    # Check functions of the string formats by name, each one takes a string and returns whether it is valid.
+    FORMATS = FORMATS
+
+    # Types, which values are validated by nested calls, so the deadline is checked by the nested values.
+    NESTED_TYPES = frozenset(('object', 'array'))
+
+    # Deadline of the validation, it is set on a copy of the validator by `validate`.
+    _timeout = None
+    _deadline = None
+
+    # Item types, which arrays can be checked in bulk, and the exact Python types they accept as is.
+    BULK_ITEM_TYPES = {
+        'integer': frozenset((int,)),
+        'float': frozenset((float,)),
+        'number': frozenset((int, float)),
+    }
+    BULK_ITEM_PARAMS = frozenset(('type', 'default', 'nullable', 'required', 'min', 'max', 'allowed'))
+    # Buffer kinds (as in `numpy.dtype.kind`), which items are accepted as is.
+    BULK_BUFFER_KINDS = {
+        'integer': 'iu',
+        'float': 'f',
+        'number': 'iuf',
+    }
+
+    def __init__(self, *, max_issues: int = None, max_depth: int = None, max_nodes: int = None,
+                 max_string_length: int = None, max_keys: int = None):
+        """
+        Parameters
+        ----------
+        max_issues : int, optional
+            Maximum number of issues collected by each object or array, after which its validation is stopped. It
+            bounds the cost of rejecting a large invalid value.
+        max_depth : int, optional
+            Maximum nesting depth of objects and arrays in a validated value.
+        max_nodes : int, optional
+            Maximum total number of values (including nested ones) in a validated value.
+        max_string_length : int, optional
+            Maximum length of any string in a validated value.
+        max_keys : int, optional
+            Maximum number of keys of any object in a validated value.
+        """
+        self.max_issues = max_issues
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.max_string_length = max_string_length
+        self.max_keys = max_keys
+
+        self._record_classes = {}
+        self._batched_schemas = {}
+        self._object_key_sets = {}
+        self._batch_loaders = {}
+
+    @staticmethod
+    def _limit(limit: int = None, default: int = None):
+        """
+        Returns the effective limit, given its own value and the validator default.
+        """
+        if limit is None:
+            return default
 
-    def __init__(self):
-        pass
+        if default is None:
+            return limit
+
+        return min(limit, default)
 
-    async def validate(self, value, *, type: str, required: bool = True, strict_mode: bool = True, **kwargs):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._types = _resolve_types(cls)
+
+    @classmethod
+    def register_type(cls, name: str, func=None, *, is_async: bool = None, batch=None):
+        """
+        Registers a type of the validator class and its subclasses.
+
+        Parameters
+        ----------
+        name : str
+            Type name, used as `type` in the schemas.
+        func : callable, optional
+            Validate function, which is called as `func(validator, value, **params, strict_mode=strict_mode)` and
+            returns the validated value or raises `ValidationError`.
+        is_async : bool, optional
+            Whether the function returns an awaitable, by default it is detected once, when the type is registered.
+        batch : callable, optional
+            Batch function, which is called as `batch(validator, values, **params, strict_mode=strict_mode)` and
+            returns the list of the results in the same order: validated values or `ValidationError` instances.
+            All the values of the type (after `func`, if it is given), which are validated within one event loop
+            tick, are checked by a single call, e.g. one `WHERE id IN (...)` query. Batched types require a running
+            event loop, so they can not be validated by `Schema.validate_sync`.
+        """
+        if func is None and batch is None:
+            raise TypeError("either validate or batch function is required")
+
+        if is_async is None:
+            is_async = iscoroutinefunction(func)
+
+        if '_registered_types' not in vars(cls):
+            cls._registered_types = {}
+        cls._registered_types[name] = (func, is_async, batch)
+
+        # The subclasses, even the ones created before, see the type unless they override it.
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            klass._types = _resolve_types(klass)
+            classes.extend(klass.__subclasses__())
+
+    @classmethod
+    def get_type(cls, name: str) -> tuple:
+        """
+        Returns the validate function of a type, whether it is a coroutine function and the batch function, or `None`
+        if the type is unknown.
+        """
+        return cls._types.get(name)
+
+    def compile(self, schema: dict, *, optimize: bool = True):
+        """
+        Compiles a schema, which is validated by this validator.
+
+        Parameters
+        ----------
+        schema : dict
+            ...
+        optimize : bool, optional
+            Removes redundant checks and replaces constraints with cheaper equivalent ones.
+
+        Returns
+        -------
+        Schema
+        """
+        from .schema import Schema
+
+        return Schema(schema, validator=self, optimize=optimize)
+
+    async def validate(self, value, *, type: str, required: bool = True, strict_mode: bool = True,
+                       max_depth: int = None, max_nodes: int = None, max_string_length: int = None,
+                       max_keys: int = None, timeout: float = None, **kwargs):
         """
 
         Parameters
@@ -78,23 +769,373 @@ class Validator:
             ...
         strict_mode : bool, optional
             Enables strict type checking.
+        max_depth : int, optional
+            Maximum nesting depth of objects and arrays, overrides the validator default if lower.
+        max_nodes : int, optional
+            Maximum total number of values, overrides the validator default if lower.
+        max_string_length : int, optional
+            Maximum length of any string, overrides the validator default if lower.
+        max_keys : int, optional
+            Maximum number of keys of any object, overrides the validator default if lower.
+        timeout : float, optional
+            Time budget in seconds. The deadline is checked before each nested value and bounds the asynchronous
+            checks, which are cancelled when it expires.
         kwargs : dict
             ...
 
         Returns
         -------
 
+        Raises
+        ------
+        ValidationTimeout
+            If the deadline has expired, its `path` is the path of the value reached.
         """
-        validate_func = getattr(self, 'validate_{type}'.format(type=type))
-        if iscoroutinefunction(validate_func):
-            value = await validate_func(value, **kwargs, strict_mode=strict_mode)
+        validator = self
+        if timeout is not None:
+            # The deadline is kept by a copy of the validator, so concurrent calls do not share it.
+            validator = copy(self)
+            validator._timeout = timeout
+            validator._deadline = monotonic() + timeout
+
+        # size guards
+        limits = (
+            self._limit(max_depth, self.max_depth),
+            self._limit(max_nodes, self.max_nodes),
+            self._limit(max_string_length, self.max_string_length),
+            self._limit(max_keys, self.max_keys),
+        )
+        if type == 'json':
+            # The size of a JSON document is checked as it is parsed, rather than the length of its text.
+            kwargs.update(zip(('max_depth', 'max_nodes', 'max_string_length', 'max_keys'), limits))
+        elif limits != (None, None, None, None):
+            self._check_size(value, *limits)
+
+        return await validator._validate(value, type=type, strict_mode=strict_mode, **kwargs)
+
+    async def _validate(self, value, *, type: str, required: bool = True, strict_mode: bool = True, **kwargs):
+        """
+        Validates a value (without the size guards), it is called for each nested value.
+        """
+        try:
+            validate_func, is_async, batch = self._types[type]
+        except KeyError:
+            raise AttributeError("unknown type '{0}'".format(type))
+
+        if self._deadline is not None:
+            return await self._validate_until(value, validate_func, is_async, batch, type=type, strict_mode=strict_mode,
+                                              **kwargs)
+
+        if validate_func is None:
+            pass
+        elif is_async:
+            value = await validate_func(self, value, **kwargs, strict_mode=strict_mode)
         else:
-            value = validate_func(value, **kwargs, strict_mode=strict_mode)
+            value = validate_func(self, value, **kwargs, strict_mode=strict_mode)
+
+        if batch is not None:
+            value = await self._batch_loader(type, batch).load(value, kwargs, strict_mode)
 
         return value
 
+    async def _validate_until(self, value, validate_func, is_async: bool, batch, *, type: str,
+                              strict_mode: bool = True, **kwargs):
+        """
+        Validates a value before the deadline, the asynchronous checks, except the nested values, are cancelled when
+        it expires.
+        """
+        remaining = self._deadline - monotonic()
+        if remaining <= 0:
+            raise ValidationTimeout(self._timeout)
+
+        try:
+            if validate_func is None:
+                pass
+            elif is_async and type in self.NESTED_TYPES:
+                value = await validate_func(self, value, **kwargs, strict_mode=strict_mode)
+            elif is_async:
+                value = await wait_for(validate_func(self, value, **kwargs, strict_mode=strict_mode), remaining)
+            else:
+                value = validate_func(self, value, **kwargs, strict_mode=strict_mode)
+
+            if batch is not None:
+                remaining = self._deadline - monotonic()
+                if remaining <= 0:
+                    raise ValidationTimeout(self._timeout)
+                value = await wait_for(self._batch_loader(type, batch).load(value, kwargs, strict_mode), remaining)
+        except ValidationTimeout:
+            raise
+        except AsyncTimeoutError:
+            if monotonic() < self._deadline:
+                raise
+            raise ValidationTimeout(self._timeout) from None
+
+        return value
+
+    def _batch_loader(self, type: str, batch) -> BatchLoader:
+        """
+        Returns the batch loader of a type for the current event loop.
+        """
+        loop = get_event_loop()
+        loader = self._batch_loaders.get(type)
+        if loader is None or loader.loop is not loop or loader.batch is not batch:
+            loader = self._batch_loaders[type] = BatchLoader(self, batch)
+
+        return loader
+
+    def _cached(self, cache: dict, schema, factory):
+        """
+        Returns the value derived from a schema (or its properties) by the factory, it is computed once per dict.
+
+        The dict is kept in the cache along with the value, so its id can not be reused by another dict while it is
+        cached. Concurrent validations may compute a value twice or clear the cache, which only costs the
+        recomputation: a value is never returned for another dict.
+
+        Compiled schemas are read-only. A plain dict may be changed after its first use, so its items are kept as
+        well and the value is recomputed once a key is added, removed or set to another object. Changes inside the
+        nested dicts are not detected, such schemas have to be changed by replacing the nested dicts.
+        """
+        entry = cache.get(id(schema))
+        if entry is None or entry[0] is not schema or entry[2] is not None and not _unchanged(schema, entry[2]):
+            if len(cache) >= self.MAX_CACHE_SIZE:
+                cache.clear()
+            items = None if isinstance(schema, MappingProxyType) else tuple(schema.items())
+            entry = cache[id(schema)] = (schema, factory(schema), items)
+
+        return entry[1]
+
+    def _has_batched(self, schema) -> bool:
+        """
+        Checks if the schema or its nested schemas have batched types, so that their values have to be validated
+        concurrently to be coalesced.
+        """
+        return self._cached(self._batched_schemas, schema, self._find_batched)
+
+    def _find_batched(self, schema) -> bool:
+        """
+        Looks for batched types in the schema and its nested schemas.
+        """
+        type_ = self._types.get(schema.get('type'))
+        if type_ is not None and type_[2] is not None:
+            return True
+        if schema.get('items') is not None and self._has_batched(schema['items']):
+            return True
+        if schema.get('properties') is not None:
+            return any(self._has_batched(params) for params in schema['properties'].values())
+
+        return False
+
+    def _check_size(self, value, max_depth: int = None, max_nodes: int = None, max_string_length: int = None,
+                    max_keys: int = None, *, depth: int = 1, nodes: int = 0) -> int:
+        """
+        Checks the size of a value before it is validated, without recursion and stopping at the first exceeded limit.
+
+        The depth of the value and the number of values counted before it are given for a part of a larger value,
+        returns the number of values counted with it.
+        """
+        stack = [(value, depth)]
+
+        while stack:
+            node, depth = stack.pop()
+
+            # max nodes
+            nodes += 1
+            if max_nodes is not None and nodes > max_nodes:
+                raise ValidationError(self.ERROR_MAX_NODES.format(max_nodes))
+
+            kind = JSON_TYPES.get(type(node)) or _json_type(node)
+            if kind == 'string' or isinstance(node, (bytes, bytearray)):
+                # max string length
+                if max_string_length is not None and len(node) > max_string_length:
+                    raise ValidationError(self.ERROR_STR_MAX_LENGTH.format(max_string_length))
+                continue
+
+            if kind == 'object':
+                # max keys
+                if max_keys is not None and len(node) > max_keys:
+                    raise ValidationError(self.ERROR_MAX_KEYS.format(max_keys))
+                children = node.values()
+            elif kind == 'array':
+                children = node
+            else:
+                continue
+
+            # max depth
+            if max_depth is not None and depth > max_depth:
+                raise ValidationError(self.ERROR_MAX_DEPTH.format(max_depth))
+
+            stack.extend((child, depth + 1) for child in children)
+
+        return nodes
+
+    async def revalidate(self, value, changes: list, *, type: str, strict_mode: bool = True, **kwargs):
+        """
+        `revalidate` validates only the changed parts of a previously validated value, e.g. on a partial update.
+
+        Each changed value is validated along with the rules of its container, which depend on it: required and
+        unknown keys of objects, length of arrays. Arrays with `allowed` or `unique_indexes` are validated as a whole.
+
+        Parameters
+        ----------
+        value : any
+            Previously validated value, which has been changed.
+        changes : list
+            Paths of the changed values: JSON Pointers (e.g. `/items/0/title`) or tuples of keys and indexes.
+            Or JSON Patch operations, which are applied to the value in place first.
+        type : str
+            ...
+        strict_mode : bool, optional
+            Enables strict type checking.
+        kwargs : dict
+            ...
+
+        Returns
+        -------
+        any
+        """
+        changes = list(changes)
+        if changes and isinstance(changes[0], Mapping):
+            try:
+                paths = apply_patch(value, changes)
+            except PatchError as e:
+                raise ValidationError(str(e))
+        else:
+            paths = [parse_pointer(path) if isinstance(path, str) else tuple(path) for path in changes]
+
+        schema = dict(kwargs, type=type)
+        issues = Issues()
+
+        # Values, which parents have been validated, are skipped.
+        validated = set()
+        for path in sorted(paths, key=len):
+            if any(path[:i] in validated for i in range(0, len(path) + 1)):
+                continue
+            validated.add(path)
+
+            if not path:
+                return await self.validate(value, **schema, strict_mode=strict_mode)
+
+            await self._revalidate_path(value, path, schema, issues, strict_mode=strict_mode)
+
+        if issues:
+            error = self.ERROR_OBJECT_PROPERTIES if type == 'object' else self.ERROR_ARRAY_ITEMS
+            raise ValidationError(error, issues=issues)
+
+        return value
+
+    async def _revalidate_path(self, value, path: tuple, schema: dict, issues: Issues, *, strict_mode: bool = True):
+        """
+        Walks down the path and validates the changed value along with the rules of its container.
+        """
+        parent, key, location = None, None, ()
+
+        async def validate(node, schema, location, assign):
+            try:
+                assign(await self.validate(node, **schema, strict_mode=strict_mode))
+            except ValidationError as e:
+                issues.extend(location, e)
+
+        for depth, segment in enumerate(path):
+            is_last = depth == len(path) - 1
+            node_type = schema.get('type')
+
+            if node_type == 'object' and isinstance(value, Mapping):
+                properties = schema.get('properties')
+                if properties is None:
+                    return
+
+                child_schema = self._property_schema(properties, segment)
+
+                if is_last:
+                    # unknown
+                    if child_schema is None:
+                        allow_unknown = schema.get('allow_unknown', False)
+                        if segment in value and allow_unknown == self.STRIP_UNKNOWN:
+                            del value[segment]
+                        elif segment in value and not allow_unknown:
+                            issues.add(location + (segment,), self.ERROR_UNKNOWN_FIELD)
+                        return
+
+                    # required / default
+                    if segment not in value:
+                        if child_schema.get('required', True):
+                            issues.add(location + (segment,), self.ERROR_REQUIRED_FIELD)
+                        elif 'default' in child_schema:
+                            value[segment] = child_schema['default']
+                        return
+
+                    return await validate(value[segment], child_schema, location + (segment,),
+                                          partial(value.__setitem__, segment))
+
+                if child_schema is not None and segment in value:
+                    parent, key, location = value, segment, location + (segment,)
+                    value, schema = value[segment], child_schema
+                    continue
+
+            elif node_type == 'array' and isinstance(value, Sequence) and not isinstance(value, str):
+                try:
+                    index = int(segment)
+                except (TypeError, ValueError):
+                    index = -1
+
+                # Items are compared to each other, so the array is validated as a whole.
+                if schema.get('allowed') is not None or schema.get('unique_indexes'):
+                    break
+
+                if is_last:
+                    # minlength / maxlength
+                    try:
+                        minlength, maxlength = schema.get('minlength'), schema.get('maxlength')
+                        if minlength is not None and len(value) < minlength:
+                            raise ValidationError(self.ERROR_MIN_LENGTH.format(minlength))
+                        if maxlength is not None and len(value) > maxlength:
+                            raise ValidationError(self.ERROR_MAX_LENGTH.format(maxlength))
+                    except ValidationError as e:
+                        if not location:
+                            raise
+                        issues.add(location, e.msg)
+                        return
+
+                    # A removed item
+                    if not 0 <= index < len(value) or schema.get('items') is None:
+                        return
+
+                    return await validate(value[index], schema['items'], location + (index,),
+                                          partial(value.__setitem__, index))
+
+                if schema.get('items') is not None and 0 <= index < len(value):
+                    parent, key, location = value, index, location + (index,)
+                    value, schema = value[index], schema['items']
+                    continue
+
+            # The path leads nowhere in the schema, so its deepest known value is validated as a whole.
+            break
+
+        if parent is None:
+            await self.validate(value, **schema, strict_mode=strict_mode)
+        else:
+            await validate(value, schema, location, partial(parent.__setitem__, key))
+
+    @staticmethod
+    def _property_schema(properties: dict, key):
+        """
+        Returns the schema of the object property, which may be declared with a regular expression.
+        """
+        if not isinstance(key, str):
+            return None
+
+        if key in properties and not (key.startswith('^') and key.endswith('$')):
+            return properties[key]
+
+        for prop, validator_params in properties.items():
+            if prop.startswith('^') and prop.endswith('$') and re.fullmatch(prop, key):
+                return validator_params
+
+        return None
+
     async def validate_object(self, value, *, properties: dict = None, default: dict = None, nullable: bool = False,
-                              allow_unknown: bool = False, strict_mode: bool = True):
+                              allow_unknown=False, max_issues: int = None, record=False,
+                              lazy: bool = False, strict_mode: bool = True):
         """
 
         Parameters
@@ -107,16 +1148,25 @@ class Validator:
             ...
         nullable : bool, optional
             ...
-        allow_unknown : bool, optional
-            ...
+        allow_unknown : bool, str, optional
+            Whether the keys, which are not in the properties, are allowed. If it is `STRIP_UNKNOWN` ('strip'), they
+            are dropped: if there are any, the declared properties are copied into a new dict, which is returned.
+        max_issues : int, optional
+            Maximum number of issues, after which the validation is stopped and the issues are marked as truncated.
+        record : bool, type, optional
+            Returns a `Record` (an instance of a `__slots__` class generated for the properties, or of the given
+            `Record` subclass) instead of a dict. Unknown and regular expression properties are not allowed.
+        lazy : bool, optional
+            Checks only the type, required and unknown keys, and returns a `LazyObject`, which validates each property
+            on first read. Its `resolve` method validates the remaining properties.
         strict_mode : bool, optional
             Enables strict type checking.
 
         Returns
         -------
-        dict
+        dict, Record, LazyObject
         """
-        issues = {}
+        issues = Issues()
 
         # nullable
         if value is None and nullable is False:
@@ -126,57 +1176,115 @@ class Validator:
             return value
 
         # type
-        if not isinstance(value, Mapping):
+        if type(value) is not dict and (JSON_TYPES.get(type(value)) or _json_type(value)) != 'object':
             raise ValidationError(self.ERROR_BAD_TYPE.format('object'))
 
         # properties
         if properties is not None:
-            _properties = {}
+            limit = self._limit(max_issues, self.max_issues)
+            keys = self._object_keys(properties)
 
-            #
-            for prop, validator_params in properties.items():
-                # If the properties key is a regular expression.
-                if prop.startswith('^') and prop.endswith('$'):
-                    for object_key in value.keys():
-                        # If the object key is not found in the object properties.
-                        if object_key not in properties.keys():
-                            # If the object key matches the regular expression of the object properties.
-                            if re.fullmatch(prop, object_key):
-                                _properties[object_key] = validator_params
-                else:
-                    _properties[prop] = validator_params
+            # Declared properties, which are not in the object, and object keys, which are not declared.
+            absent = keys.names.difference(value.keys())
+            unknown = value.keys() - keys.names
+
+            if keys.patterns is not None and unknown:
+                _properties = keys.expand(value, unknown)
+                unknown.difference_update(_properties.keys())
+            else:
+                _properties = keys.properties
+
+            # The output is built without the unknown keys, in the same pass.
+            if allow_unknown == self.STRIP_UNKNOWN and unknown:
+                value = {key: item for key, item in value.items() if key not in unknown}
+
+            # Properties with batched types are validated concurrently, so that their checks are coalesced.
+            results = None
+            if keys.batched and not lazy:
+                present = [prop for prop in _properties if prop not in absent]
+                results = dict(zip(present, await _gather(
+                    self._validate(value[prop], **_properties[prop], strict_mode=strict_mode) for prop in present)))
 
             #
             for prop, validator_params in _properties.items():
+                if limit is not None and len(issues) >= limit:
+                    issues.truncate(limit)
+                    break
+
+                if absent and prop in absent:
+                    if prop in keys.required:
+                        issues.add((prop,), self.ERROR_REQUIRED_FIELD)
+                    elif prop in keys.defaults:
+                        # Returns default values
+                        value[prop] = keys.defaults[prop]
+                    continue
+
+                if lazy:
+                    continue
+
                 try:
-                    _value = value[prop]
-                except KeyError:
-                    is_required = validator_params['required'] if 'required' in validator_params else True
-                    if is_required is True:
-                        issues[prop] = self.ERROR_REQUIRED_FIELD
+                    if results is None:
+                        value[prop] = await self._validate(value[prop], **validator_params, strict_mode=strict_mode)
                     else:
-                        # Returns default values
-                        if 'default' in validator_params:
-                            value[prop] = validator_params['default']
-                else:
-                    try:
-                        value[prop] = await self.validate(_value, **validator_params, strict_mode=strict_mode)
-                    except ValidationError as e:
-                        issues[prop] = e.msg if e.issues is None else e.issues
+                        value[prop] = _result(results[prop])
+                except ValidationError as e:
+                    issues.extend((prop,), e)
+                except ValidationTimeout as e:
+                    e.path = (prop,) + e.path
+                    raise
 
-            if allow_unknown is False:
+            if allow_unknown is False and unknown and not issues.truncated:
+                # Unknown keys are reported in the object order.
                 for object_key in value.keys():
-                    if object_key not in _properties.keys():
-                        issues[object_key] = self.ERROR_UNKNOWN_FIELD
+                    if object_key in unknown:
+                        if limit is not None and len(issues) >= limit:
+                            issues.truncate(limit)
+                            break
+
+                        issues.add((object_key,), self.ERROR_UNKNOWN_FIELD)
 
-        if len(issues.keys()):
+        if issues:
             raise ValidationError(self.ERROR_OBJECT_PROPERTIES, issues=issues)
 
+        # record
+        if record:
+            if properties is None or allow_unknown is True:
+                raise ValueError("record objects require properties and do not allow unknown ones")
+            if lazy:
+                raise ValueError("record objects can not be lazy")
+            record_class = record if isinstance(record, type) else self._record_class(properties)
+            return record_class.from_dict(value)
+
+        # lazy
+        if lazy and properties is not None:
+            from .lazy import LazyObject
+            return LazyObject(self, value, _properties, max_issues=max_issues, strict_mode=strict_mode)
+
         return value
 
+    def _object_keys(self, properties: dict) -> _ObjectKeys:
+        """
+        Returns the key sets of the object properties, they are computed once per properties dict.
+        """
+        return self._cached(self._object_key_sets, properties, self._make_object_keys)
+
+    def _make_object_keys(self, properties: dict) -> _ObjectKeys:
+        """
+        Computes the key sets of the object properties.
+        """
+        keys = _ObjectKeys(properties)
+        keys.batched = any(self._has_batched(validator_params) for validator_params in properties.values())
+        return keys
+
+    def _record_class(self, properties: dict) -> type:
+        """
+        Returns the record class of the object properties, it is generated once per properties dict.
+        """
+        return self._cached(self._record_classes, properties, partial(make_record_class, 'Record'))
+
     async def validate_array(self, value, *, items: dict = None, default: str = None, nullable: bool = False,
                              minlength: int = None, maxlength: int = None, allowed: list = None,
-                             unique_indexes: list = None, strict_mode: bool = True):
+                             unique_indexes: list = None, max_issues: int = None, strict_mode: bool = True):
         """
 
         Parameters
@@ -196,15 +1304,23 @@ class Validator:
         allowed : list, optional
             ...
         unique_indexes : list, optional
-            ...
+            Indexes, which values must be unique across the items. An index is a property name or a list of property
+            names of the object items (composite key), an empty list indexes the whole item. Items, which index
+            value is missing or null, are not indexed. Unhashable values are compared by value, lists as tuples and
+            objects as sets of their items. Booleans are distinct from the numbers, while the numbers are compared
+            by value, e.g. `1` and `1.0` are duplicates.
+        max_issues : int, optional
+            Maximum number of issues, after which the validation is stopped and the issues are marked as truncated.
         strict_mode : bool, optional
             Enables strict type checking.
 
         Returns
         -------
-
+        list, async iterator
+            The array, or an async iterator of the validated items if the value is an async iterable, see
+            `_validate_stream`.
         """
-        issues = {}
+        issues = Issues()
 
         # nullable
         if value is None and nullable is False:
@@ -214,7 +1330,15 @@ class Validator:
             return value
 
         # type
-        if not isinstance(value, Sequence) or isinstance(value, str):
+        kind = 'array' if type(value) is list else JSON_TYPES.get(type(value)) or _json_type(value)
+        is_buffer = kind == 'buffer'
+        if is_buffer:
+            if getattr(value, 'ndim', 1) != 1:
+                raise ValidationError(self.ERROR_BAD_TYPE.format("array"))
+        elif kind != 'array':
+            if hasattr(type(value), '__aiter__'):
+                return self._validate_stream(value, items=items, minlength=minlength, maxlength=maxlength,
+                                             allowed=allowed, unique_indexes=unique_indexes, strict_mode=strict_mode)
             raise ValidationError(self.ERROR_BAD_TYPE.format("array"))
 
         # minlength
@@ -229,26 +1353,193 @@ class Validator:
 
         # allowed
         if allowed is not None:
-            disallowed = set(value) - set(allowed)
+            disallowed = set(value).difference(allowed)
             if disallowed:
                 raise ValidationError(self.ERROR_UNALLOWED_VALUES.format(list(disallowed)))
 
         # items
-        if items is not None:
+        in_bulk = False
+        if items is not None and is_buffer:
+            in_bulk = self._validate_buffer_in_bulk(value, items)
+            if not in_bulk:
+                # Items, which can not be checked right on the buffer, are boxed and validated as a list.
+                value = value.tolist()
+        elif items is not None:
+            in_bulk = self._validate_items_in_bulk(value, items)
+
+        unique = _UniqueIndexes(unique_indexes) if unique_indexes else None
+        limit = self._limit(max_issues, self.max_issues)
+
+        if items is None or in_bulk:
+            # unique indexes
+            if unique is not None:
+                for i, j in unique.find_duplicates(value):
+                    if limit is not None and len(issues) >= limit:
+                        issues.truncate(limit)
+                        break
+
+                    issues.add((i,), self.ERROR_NOT_UNIQUE.format(j))
+        else:
+            # Items with batched types are validated concurrently, so that their checks are coalesced.
+            results = None
+            if self._has_batched(items):
+                results = await _gather(self._validate(item, **items, strict_mode=strict_mode) for item in value)
+
+            # Validates one item at a time, it also locates the invalid items if the bulk check has failed.
             for i in range(0, len(value)):
+                if limit is not None and len(issues) >= limit:
+                    issues.truncate(limit)
+                    break
+
                 try:
-                    value[i] = await self.validate(value[i], **items, strict_mode=strict_mode)
+                    if results is None:
+                        value[i] = await self._validate(value[i], **items, strict_mode=strict_mode)
+                    else:
+                        value[i] = _result(results[i])
                 except ValidationError as e:
-                    issues[i] = e.msg if e.issues is None else e.issues
+                    issues.extend((i,), e)
+                except ValidationTimeout as e:
+                    e.path = (i,) + e.path
+                    raise
+                else:
+                    # unique indexes
+                    if unique is not None:
+                        j = unique.add(i, value[i])
+                        if j is not None:
+                            issues.add((i,), self.ERROR_NOT_UNIQUE.format(j))
 
-        if len(issues.keys()):
+        if issues:
             raise ValidationError(self.ERROR_ARRAY_ITEMS, issues=issues)
 
         return value
 
+    async def _validate_stream(self, value, *, items: dict = None, minlength: int = None, maxlength: int = None,
+                               allowed: list = None, unique_indexes: list = None, strict_mode: bool = True):
+        """
+        Validates the items of an async iterable as they are consumed.
+
+        The next item is pulled from the iterable only when the previous one has been consumed, so the items are not
+        accumulated, except the index values of `unique_indexes`. The first invalid item raises `ValidationError`,
+        when it is reached, with the issues at its index; `minlength` is checked at the end of the iterable. The
+        iterable is closed by its `aclose`, if any, once the validation is over.
+        """
+        unique = _UniqueIndexes(unique_indexes) if unique_indexes else None
+        count = 0
+
+        try:
+            async for item in value:
+                # maxlength, without pulling the rest of the items
+                if maxlength is not None and count >= maxlength:
+                    raise ValidationError(self.ERROR_MAX_LENGTH.format(maxlength))
+
+                # allowed
+                if allowed is not None and item not in allowed:
+                    raise ValidationError(self.ERROR_UNALLOWED_VALUES.format([item]))
+
+                issues = Issues()
+                try:
+                    if items is not None:
+                        item = await self._validate(item, **items, strict_mode=strict_mode)
+
+                    # unique indexes
+                    if unique is not None:
+                        j = unique.add(count, item)
+                        if j is not None:
+                            raise ValidationError(self.ERROR_NOT_UNIQUE.format(j))
+                except ValidationError as e:
+                    issues.extend((count,), e)
+                    raise ValidationError(self.ERROR_ARRAY_ITEMS, issues=issues)
+                except ValidationTimeout as e:
+                    e.path = (count,) + e.path
+                    raise
+
+                count += 1
+                yield item
+
+            # minlength
+            if minlength is not None and count < minlength:
+                raise ValidationError(self.ERROR_MIN_LENGTH.format(minlength))
+        finally:
+            # The source, e.g. a database cursor, is closed when an item is invalid or the consumer stops early.
+            aclose = getattr(value, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+
+    def _validate_items_in_bulk(self, value, items: dict) -> bool:
+        """
+        Checks the items of a homogeneous numeric array all at once.
+
+        Parameters
+        ----------
+        value : sequence
+            Array, which items to be validated.
+        items : dict
+            Item schema.
+
+        Returns
+        -------
+        bool
+            `True` if all the items are valid as is, `False` if they have to be validated one by one: the schema or
+            the item types are not supported by the bulk check, or some item is invalid.
+        """
+        if not self._supports_bulk_items(items):
+            return False
+
+        if not set(map(type, value)) <= self.BULK_ITEM_TYPES[items['type']]:
+            return False
+
+        return _check_numbers(value, items.get('min'), items.get('max'), items.get('allowed'))
+
+    def _validate_buffer_in_bulk(self, value, items: dict) -> bool:
+        """
+        Checks the items of a typed buffer right on the buffer, without boxing them.
+
+        Parameters
+        ----------
+        value : numpy.ndarray, array.array, memoryview
+            One-dimensional buffer, which items to be validated.
+        items : dict
+            Item schema.
+
+        Returns
+        -------
+        bool
+            `True` if all the items are valid as is, `False` if they have to be validated one by one: the schema or
+            the buffer dtype are not supported by the bulk check, or some item is invalid.
+        """
+        if not self._supports_bulk_items(items):
+            return False
+
+        kind, itemsize = _buffer_dtype(value)
+        if kind not in self.BULK_BUFFER_KINDS[items['type']]:
+            return False
+
+        min_value, max_value = items.get('min'), items.get('max')
+
+        # Bounds, which are already guaranteed by the item size, are not checked.
+        if kind in 'iu':
+            bits = itemsize * 8
+            lowest, highest = (0, 2 ** bits - 1) if kind == 'u' else (-2 ** (bits - 1), 2 ** (bits - 1) - 1)
+            if min_value is not None and min_value <= lowest:
+                min_value = None
+            if max_value is not None and max_value >= highest:
+                max_value = None
+
+        return _check_numbers(value, min_value, max_value, items.get('allowed'))
+
+    def _supports_bulk_items(self, items: dict) -> bool:
+        """
+        Checks if the items of the schema can be checked in bulk.
+        """
+        if items.get('type') not in self.BULK_ITEM_TYPES or not items.keys() <= self.BULK_ITEM_PARAMS:
+            return False
+
+        # Overridden item validators must see every item.
+        return self._types[items['type']] is Validator._types[items['type']]
+
     def validate_string(self, value, *, default: str = None, nullable: bool = False, minlength: int = None,
                         maxlength: int = None, empty: bool = False, allowed: list = None, regex: str = None,
-                        strict_mode: bool = True) -> str:
+                        format: str = None, strict_mode: bool = True) -> str:
         """
         `validate_string` validates a string.
 
@@ -272,6 +1563,8 @@ class Validator:
             ...
         regex : str, optional
             ...
+        format : str, optional
+            Built-in format: 'uuid', 'email', 'ipv4', 'ipv6', 'date' or 'hostname', see `FORMATS`.
         strict_mode : bool, optional
             Enables strict type checking.
 
@@ -287,11 +1580,12 @@ class Validator:
             return value
 
         # type
-        if not isinstance(value, str):
+        kind = 'string' if type(value) is str else JSON_TYPES.get(type(value)) or _json_type(value)
+        if kind != 'string':
             if strict_mode is True:
                 raise ValidationError(self.ERROR_BAD_TYPE.format('string'))
 
-            if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if kind == 'integer' or kind == 'float':
                 # Tries to convert value
                 value = str(value)  # TODO: logging warning?
             else:
@@ -322,8 +1616,179 @@ class Validator:
             if not pattern.match(value):
                 raise ValidationError(self.ERROR_STR_REGEX.format(regex))
 
+        # format
+        if format is not None:
+            try:
+                is_valid = self.FORMATS[format]
+            except KeyError:
+                raise ValueError("unknown format '{0}'".format(format))
+            if not is_valid(value):
+                raise ValidationError(self.ERROR_STR_FORMAT.format(format))
+
         return value
 
+    def validate_bytes(self, value, *, default: bytes = None, nullable: bool = False, minlength: int = None,
+                       maxlength: int = None, empty: bool = False, regex=None, encoding: str = None,
+                       decode: bool = False, strict_mode: bool = True):
+        """
+        `validate_bytes` validates raw bytes: `bytes`, `bytearray` or a `memoryview`.
+
+        The checks run on the buffer, so the value is not copied. If strict mode is disabled, a `str` is encoded to
+        UTF-8.
+
+        Parameters
+        ----------
+        value : any
+            Value, to be validated.
+        default : bytes, optional
+            ...
+        nullable : bool, optional
+            ...
+        minlength : int, optional
+            Minimum length in bytes.
+        maxlength : int, optional
+            Maximum length in bytes.
+        empty : bool, optional
+            ...
+        regex : bytes, str, optional
+            Regular expression, which is matched against the bytes, a `str` is encoded to UTF-8.
+        encoding : str, optional
+            Encoding, which the bytes must be valid in, e.g. 'utf-8'.
+        decode : bool, optional
+            Returns the bytes decoded as `str`, by the `encoding` or UTF-8.
+        strict_mode : bool, optional
+            Enables strict type checking.
+
+        Returns
+        -------
+        bytes, bytearray, memoryview, str
+            The value itself, or the decoded string.
+        """
+        # nullable
+        if value is None and nullable is False:
+            raise ValidationError(self.ERROR_NOT_NULLABLE)
+
+        if value is None:
+            return value
+
+        # type
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            if strict_mode is True or not isinstance(value, str):
+                raise ValidationError(self.ERROR_BAD_TYPE.format('bytes'))
+            value = value.encode()
+
+        with memoryview(value) as view:
+            if view.ndim != 1 or not view.c_contiguous:
+                raise ValidationError(self.ERROR_BAD_TYPE.format('bytes'))
+            size = view.nbytes
+
+            # minlength
+            if minlength is not None:
+                if size < minlength:
+                    raise ValidationError(self.ERROR_BYTES_MIN_LENGTH.format(minlength))
+
+            # maxlength
+            if maxlength is not None:
+                if size > maxlength:
+                    raise ValidationError(self.ERROR_BYTES_MAX_LENGTH.format(maxlength))
+
+            # empty
+            if not empty and size == 0:
+                raise ValidationError(self.ERROR_EMPTY_NOT_ALLOWED)
+
+            # regex
+            if regex is not None:
+                pattern = re.compile(regex.encode() if isinstance(regex, str) else regex)
+                with view.cast('B') as octets:
+                    if not pattern.match(octets):
+                        raise ValidationError(self.ERROR_STR_REGEX.format(regex))
+
+            # encoding
+            if encoding is not None or decode:
+                encoding = encoding or 'utf-8'
+                # Decoding is the check, the string is kept only if it is asked for.
+                try:
+                    string = str(view, encoding)
+                except UnicodeDecodeError:
+                    raise ValidationError(self.ERROR_BYTES_ENCODING.format(encoding))
+                if decode:
+                    return string
+
+        return value
+
+    async def validate_json(self, value, *, schema: dict, nullable: bool = False, max_issues: int = None,
+                            max_depth: int = None, max_nodes: int = None, max_string_length: int = None,
+                            max_keys: int = None, strict_mode: bool = True):
+        """
+        `validate_json` parses a JSON document and validates it against the schema.
+
+        With the maximum number of issues or a size limit, the document is validated in a single pass: objects with
+        properties are validated key by key as they are parsed, so the parsing stops early, as soon as the maximum
+        number of issues or a size limit is reached. Without them the guided parsing can not pay off, so the
+        document is parsed at once by `json.loads` and then validated, which is faster for the valid documents.
+
+        Parameters
+        ----------
+        value : any
+            JSON document: `str`, `bytes`, `bytearray` or `memoryview`.
+        schema : dict
+            Schema of the document, e.g. `{'type': 'object', 'properties': {...}}`.
+        nullable : bool, optional
+            ...
+        max_issues : int, optional
+            Maximum number of issues, after which the parsing is stopped and the issues are marked as truncated.
+        max_depth : int, optional
+            Maximum nesting depth of objects and arrays, overrides the validator default if lower.
+        max_nodes : int, optional
+            Maximum total number of values, overrides the validator default if lower.
+        max_string_length : int, optional
+            Maximum length of any string, overrides the validator default if lower.
+        max_keys : int, optional
+            Maximum number of keys of any object, overrides the validator default if lower.
+        strict_mode : bool, optional
+            Enables strict type checking.
+
+        Returns
+        -------
+        any
+            The parsed and validated document.
+        """
+        from .decoder import SchemaDecoder
+
+        # nullable
+        if value is None and nullable is False:
+            raise ValidationError(self.ERROR_NOT_NULLABLE)
+
+        if value is None:
+            return value
+
+        # type
+        if not isinstance(value, (str, bytes, bytearray, memoryview)):
+            raise ValidationError(self.ERROR_BAD_TYPE.format('json'))
+
+        limits = (
+            self._limit(max_issues, self.max_issues),
+            self._limit(max_depth, self.max_depth),
+            self._limit(max_nodes, self.max_nodes),
+            self._limit(max_string_length, self.max_string_length),
+            self._limit(max_keys, self.max_keys),
+        )
+
+        try:
+            if limits == (None, None, None, None, None):
+                document = loads(value.tobytes() if isinstance(value, memoryview) else value)
+                return await self._validate(document, **schema, strict_mode=strict_mode)
+
+            decoder = SchemaDecoder(self, max_issues=max_issues, strict_mode=strict_mode, max_depth=max_depth,
+                                    max_nodes=max_nodes, max_string_length=max_string_length, max_keys=max_keys)
+            return await decoder.decode(value, schema)
+        except (JSONDecodeError, UnicodeDecodeError):
+            raise ValidationError(self.ERROR_BAD_JSON)
+        except RecursionError:
+            # The document is nested deeper than the interpreter can parse.
+            max_depth = self._limit(max_depth, self.max_depth)
+            raise ValidationError(self.ERROR_MAX_DEPTH.format(max_depth or getrecursionlimit()))
+
     def validate_integer(self, value, *, default: int = None, nullable: bool = False, min: int = None, max: int = None,
                          allowed: list = None, strict_mode: bool = True) -> int:
         """
@@ -357,7 +1822,13 @@ class Validator:
             return value
 
         # type
-        if not isinstance(value, int):
+        kind = 'integer' if type(value) is int else JSON_TYPES.get(type(value)) or _json_type(value)
+        if kind == 'boolean':
+            if strict_mode:
+                raise ValidationError(self.ERROR_BAD_TYPE.format("integer"))
+
+            value = int(value)
+        elif kind != 'integer':
             if strict_mode:
                 raise ValidationError(self.ERROR_BAD_TYPE.format("integer"))
 
@@ -369,18 +1840,12 @@ class Validator:
             except TypeError as e:
                 raise ValidationError(self.ERROR_BAD_TYPE.format("integer"))
 
-            if isinstance(value, float):
+            if kind == 'float':
                 if int_value != value:
                     raise ValidationError(self.ERROR_BAD_TYPE.format("integer"))
 
             value = int_value
 
-        if isinstance(value, bool):
-            if strict_mode:
-                raise ValidationError(self.ERROR_BAD_TYPE.format("integer"))
-
-            value = int(value)
-
         # min
         if min is not None:
             if value < min:
@@ -431,13 +1896,14 @@ class Validator:
             return value
 
         # type
-        if not isinstance(value, float):
+        kind = 'float' if type(value) is float else JSON_TYPES.get(type(value)) or _json_type(value)
+        if kind != 'float':
             if strict_mode:
-                if not isinstance(value, int) or isinstance(value, bool):
+                if kind != 'integer':
                     raise ValidationError(self.ERROR_BAD_TYPE.format("float"))
 
             # try to convert
-            if not isinstance(value, (int, str)):
+            if kind != 'integer' and kind != 'boolean' and kind != 'string':
                 raise ValidationError(self.ERROR_BAD_TYPE.format("float"))
 
             try:
@@ -495,12 +1961,13 @@ class Validator:
             return value
 
         # type
-        if not isinstance(value, (float, int)):
+        kind = 'float' if type(value) is float else JSON_TYPES.get(type(value)) or _json_type(value)
+        if kind != 'integer' and kind != 'float' and kind != 'boolean':
             if strict_mode:
                 raise ValidationError(self.ERROR_BAD_TYPE.format("int or float"))
 
             # try to convert
-            if not isinstance(value, str):
+            if kind != 'string':
                 raise ValidationError(self.ERROR_BAD_TYPE.format("int or float"))
 
             try:
@@ -508,7 +1975,7 @@ class Validator:
             except ValueError as e:
                 raise ValidationError(self.ERROR_BAD_TYPE.format("int or float"))
 
-        if isinstance(value, bool) and strict_mode:
+        if kind == 'boolean' and strict_mode:
             raise ValidationError(self.ERROR_BAD_TYPE.format("int or float"))
 
         # min
@@ -561,12 +2028,13 @@ class Validator:
             return value
 
         # type
-        if not isinstance(value, bool):
+        kind = 'boolean' if type(value) is bool else JSON_TYPES.get(type(value)) or _json_type(value)
+        if kind != 'boolean':
             if strict_mode:
                 raise ValidationError(self.ERROR_BAD_TYPE.format("boolean"))
 
             # try to convert
-            if not isinstance(value, str):
+            if kind != 'string':
                 raise ValidationError(self.ERROR_BAD_TYPE.format("boolean"))
 
             # TODO: Move string values to params?
@@ -628,18 +2096,100 @@ class Validator:
 
         return value
 
-    async def validate_file(self, value, strict_mode: bool = True):
+    async def validate_file(self, value, *, nullable: bool = False, maxsize: int = None, content_types: list = None,
+                            checksum: str = None, strict_mode: bool = True) -> UploadedFile:
         """
+        `validate_file` validates a file while it is being read in chunks.
+
+        The file is rejected as soon as its size exceeds `maxsize` or its first bytes reveal an unallowed content
+        type, the rest of the file is not read.
 
         Parameters
         ----------
         value : any
-            Value, to be validated.
+            Value, to be validated: bytes, an object with a `read_chunk` coroutine method (such as
+            `aiohttp.BodyPartReader`), an async iterable of chunks, a file object or an object with a `file`
+            attribute (such as `aiohttp.web.FileField`).
+        nullable : bool, optional
+            ...
+        maxsize : int, optional
+            Maximum size of the file in bytes.
+        content_types : list, optional
+            Allowed content types, sniffed from the first bytes of the file, e.g. `['image/png', 'image/*']`.
+        checksum : str, optional
+            Name of the `hashlib` algorithm, which hex digest of the file is computed while reading.
         strict_mode : bool, optional
             ...
 
         Returns
         -------
+        UploadedFile
+        """
+        # nullable
+        if value is None and nullable is False:
+            raise ValidationError(self.ERROR_NOT_NULLABLE)
+
+        if value is None:
+            return value
+
+        # type
+        if not is_chunked(value):
+            raise ValidationError(self.ERROR_BAD_TYPE.format('file'))
+
+        file = UploadedFile(filename=getattr(value, 'filename', None))
+        hash_ = hashlib.new(checksum) if checksum is not None else None
+        head = b''
+
+        chunks = iter_chunks(value)
+        try:
+            async for chunk in chunks:
+                file.size += len(chunk)
+
+                # maxsize
+                if maxsize is not None and file.size > maxsize:
+                    raise ValidationError(self.ERROR_FILE_MAX_SIZE.format(maxsize))
+
+                # content types
+                if file.content_type is None:
+                    head += chunk
+                    if len(head) >= SNIFF_SIZE:
+                        file.content_type = self._check_content_type(head, content_types)
+                        head = None
 
+                if hash_ is not None:
+                    hash_.update(chunk)
+
+                file.file.write(chunk)
+
+            if file.content_type is None:
+                file.content_type = self._check_content_type(head, content_types)
+        except BaseException:
+            file.close()
+            raise
+        finally:
+            await chunks.aclose()
+
+        if hash_ is not None:
+            file.checksum = hash_.hexdigest()
+
+        file.seek(0)
+
+        return file
+
+    def _check_content_type(self, head: bytes, content_types: list = None) -> str:
         """
-        return value
+        Sniffs the content type of a file and checks that it is allowed.
+        """
+        content_type = sniff_content_type(head)
+
+        if content_types is not None:
+            for allowed in content_types:
+                if content_type == allowed or allowed.endswith('/*') and content_type.startswith(allowed[:-1]):
+                    break
+            else:
+                raise ValidationError(self.ERROR_FILE_CONTENT_TYPE.format(content_type))
+
+        return content_type
+
+
+Validator._types = _resolve_types(Validator)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from asyncio import ensure_future, get_event_loop
+
+__all__ = ['BatchLoader']
+
+
+class BatchLoader:
+    """
+    Coalesces the checks of a batched type, requested within one event loop tick, into a single batch call.
+
+    Parameters
+    ----------
+    validator : Validator
+        Validator, which is passed to the batch function.
+    batch : callable
+        Batch function, which is called as `batch(validator, values, **params, strict_mode=strict_mode)` and returns
+        the list of the results in the same order: validated values or `ValidationError` instances.
+    """
+    __slots__ = ('validator', 'batch', 'loop', 'pending')
+
+    def __init__(self, validator, batch):
+        self.validator = validator
+        self.batch = batch
+        self.loop = get_event_loop()
+        self.pending = []
+
+    def load(self, value, params: dict, strict_mode: bool = True):
+        """
+        Adds a value to the next batch.
+
+        Returns
+        -------
+        asyncio.Future
+            Future of the validated value.
+        """
+        future = self.loop.create_future()
+
+        if not self.pending:
+            self.loop.call_soon(self._dispatch)
+
+        self.pending.append((params, strict_mode, value, future))
+
+        return future
+
+    def _dispatch(self):
+        pending, self.pending = self.pending, []
+
+        # Values with different params are checked by different batches.
+        groups = []
+        for params, strict_mode, value, future in pending:
+            for group in groups:
+                if group[0] == params and group[1] == strict_mode:
+                    group[2].append((value, future))
+                    break
+            else:
+                groups.append((params, strict_mode, [(value, future)]))
+
+        for params, strict_mode, entries in groups:
+            ensure_future(self._run(params, strict_mode, entries), loop=self.loop)
+
+    async def _run(self, params: dict, strict_mode: bool, entries: list):
+        # Equal hashable values are checked once.
+        values, positions = [], []
+        indexes = {}
+        for value, _ in entries:
+            try:
+                index = indexes.setdefault((type(value), value), len(values))
+            except TypeError:
+                index = len(values)
+            if index == len(values):
+                values.append(value)
+            positions.append(index)
+
+        try:
+            results = await self.batch(self.validator, values, **params, strict_mode=strict_mode)
+            if len(results) != len(values):
+                raise RuntimeError("batch function has returned {0} results for {1} values".format(
+                    len(results), len(values)))
+        except BaseException as e:
+            for _, future in entries:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for (_, future), index in zip(entries, positions):
+            if future.done():
+                continue
+            result = results[index]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from json import JSONDecodeError, JSONDecoder, detect_encoding
+from json.decoder import WHITESPACE, scanstring
+from json.scanner import make_scanner
+
+from .aiovalidator import Validator, ValidationError, Issues, _UniqueIndexes
+
+__all__ = ['SchemaDecoder']
+
+
+class _Stop(Exception):
+    """
+    Raised when the maximum number of issues is reached, it stops the parsing.
+    """
+
+
+class SchemaDecoder:
+    """
+    JSON decoder, which validates the document against the schema as it is parsed.
+
+    Objects with properties and arrays of such objects are parsed key by key and item by item, so too long arrays are
+    reported before the rest of the document is parsed and the parsing stops as soon as the maximum number of issues
+    is reached. Any other value is parsed at once by the C scanner of `json` and validated by the validator, so the
+    arrays of scalars are still checked in bulk. The size limits of the validator are checked as the document is
+    parsed.
+
+    The issues are those of `validate` of the parsed document, but the properties of an object are validated in the
+    order of the document rather than of the schema, so with `max_issues` the kept issues may differ.
+
+    Parameters
+    ----------
+    validator : Validator
+        Validator, which validates the values.
+    max_issues : int, optional
+        Maximum number of issues, after which the parsing is stopped and the issues are marked as truncated.
+    strict_mode : bool, optional
+        Enables strict type checking.
+    max_depth : int, optional
+        Maximum nesting depth of objects and arrays, overrides the validator default if lower.
+    max_nodes : int, optional
+        Maximum total number of values, overrides the validator default if lower.
+    max_string_length : int, optional
+        Maximum length of any string, overrides the validator default if lower.
+    max_keys : int, optional
+        Maximum number of keys of any object, overrides the validator default if lower.
+    """
+    __slots__ = ('validator', 'issues', 'limit', 'strict_mode', 'limits', 'nodes', '_scan_once')
+
+    def __init__(self, validator: Validator, *, max_issues: int = None, strict_mode: bool = True,
+                 max_depth: int = None, max_nodes: int = None, max_string_length: int = None, max_keys: int = None):
+        self.validator = validator
+        self.issues = Issues()
+        self.limit = validator._limit(max_issues, validator.max_issues)
+        self.strict_mode = strict_mode
+        self.limits = (
+            validator._limit(max_depth, validator.max_depth),
+            validator._limit(max_nodes, validator.max_nodes),
+            validator._limit(max_string_length, validator.max_string_length),
+            validator._limit(max_keys, validator.max_keys),
+        )
+        if self.limits == (None, None, None, None):
+            self.limits = None
+        self.nodes = 0
+        self._scan_once = make_scanner(JSONDecoder())
+
+    async def decode(self, raw, schema: dict):
+        """
+        Parses and validates a JSON document.
+
+        Parameters
+        ----------
+        raw : str, bytes, bytearray, memoryview
+            JSON document, bytes are decoded as `json.loads` does.
+        schema : dict
+            Schema of the document, e.g. `{'type': 'object', 'properties': {...}}`.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the document is not valid JSON.
+        ValidationError
+            If the document is invalid.
+        RecursionError
+            If the document is nested too deeply to be parsed.
+        """
+        if isinstance(raw, memoryview):
+            raw = raw.tobytes()
+        if isinstance(raw, (bytes, bytearray)):
+            raw = raw.decode(detect_encoding(raw), 'surrogatepass')
+
+        if raw.startswith('\ufeff'):
+            raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)", raw, 0)
+
+        try:
+            value, end = await self._decode(raw, WHITESPACE.match(raw, 0).end(), schema, ())
+        except _Stop:
+            self.issues.truncate(self.limit)
+        else:
+            end = WHITESPACE.match(raw, end).end()
+            if end != len(raw):
+                raise JSONDecodeError("Extra data", raw, end)
+
+        if self.issues:
+            is_array = schema.get('type') == 'array'
+            msg = self.validator.ERROR_ARRAY_ITEMS if is_array else self.validator.ERROR_OBJECT_PROPERTIES
+            raise ValidationError(msg, issues=self.issues)
+
+        return value
+
+    def _add(self, path: tuple, error: ValidationError):
+        """
+        Adds the issues of a value at the path, the error of the document itself is raised.
+        """
+        if not path:
+            raise error
+
+        self.issues.extend(path, error)
+        if self.limit is not None and len(self.issues) >= self.limit:
+            raise _Stop()
+
+    def _scan(self, text: str, idx: int, depth: int) -> tuple:
+        """
+        Parses a value at once and checks its size.
+        """
+        try:
+            value, idx = self._scan_once(text, idx)
+        except StopIteration as e:
+            raise JSONDecodeError("Expecting value", text, e.value) from None
+
+        if self.limits is not None:
+            self.nodes = self.validator._check_size(value, *self.limits, depth=depth, nodes=self.nodes)
+
+        return value, idx
+
+    def _enter(self, depth: int):
+        """
+        Checks the size limits, which apply to an object or an array before its values are parsed.
+        """
+        if self.limits is None:
+            return
+
+        max_depth, max_nodes, _, _ = self.limits
+
+        # max nodes
+        self.nodes += 1
+        if max_nodes is not None and self.nodes > max_nodes:
+            raise ValidationError(self.validator.ERROR_MAX_NODES.format(max_nodes))
+
+        # max depth
+        if max_depth is not None and depth > max_depth:
+            raise ValidationError(self.validator.ERROR_MAX_DEPTH.format(max_depth))
+
+    def _is_guided(self, schema: dict, char: str) -> bool:
+        """
+        Checks if a value is parsed along with the schema, i.e. it is an object with properties or an array of such
+        values, which are validated by the built-in validators.
+        """
+        type_ = schema.get('type')
+        if type_ == 'object':
+            if char != '{' or schema.get('properties') is None or schema.get('record') or schema.get('lazy'):
+                return False
+        elif type_ == 'array':
+            items = schema.get('items')
+            if char != '[' or items is None or not isinstance(items.get('type'), str):
+                return False
+            if items['type'] not in ('object', 'array'):
+                return False
+        else:
+            return False
+
+        return self.validator.get_type(type_) is Validator.get_type(type_)
+
+    async def _decode(self, text: str, idx: int, schema: dict, path: tuple) -> tuple:
+        """
+        Parses and validates a value at the index.
+
+        Returns
+        -------
+        tuple
+            The value and the index after it.
+        """
+        if self._is_guided(schema, text[idx:idx + 1]):
+            self._enter(len(path) + 1)
+            if schema['type'] == 'object':
+                return await self._decode_object(text, idx, schema, path)
+            return await self._decode_array(text, idx, schema, path)
+
+        value, idx = self._scan(text, idx, len(path) + 1)
+        try:
+            value = await self.validator._validate(value, **schema, strict_mode=self.strict_mode)
+        except ValidationError as e:
+            self._add(path, e)
+
+        return value, idx
+
+    async def _decode_object(self, text: str, idx: int, schema: dict, path: tuple) -> tuple:
+        """
+        Parses and validates an object with properties, key by key.
+        """
+        keys = self.validator._object_keys(schema['properties'])
+        allow_unknown = schema.get('allow_unknown', False)
+        max_keys = self.limits[3] if self.limits is not None else None
+        depth = len(path) + 2
+        unknown = []
+        # Number of the stripped keys, which are not in the value.
+        stripped = 0
+        value = {}
+
+        idx = WHITESPACE.match(text, idx + 1).end()
+        if text[idx:idx + 1] == '}':
+            idx += 1
+        else:
+            while True:
+                if text[idx:idx + 1] != '"':
+                    raise JSONDecodeError("Expecting property name enclosed in double quotes", text, idx)
+                key, idx = scanstring(text, idx + 1)
+
+                # max keys
+                if max_keys is not None and key not in value and len(value) + stripped >= max_keys:
+                    raise ValidationError(self.validator.ERROR_MAX_KEYS.format(max_keys))
+
+                idx = WHITESPACE.match(text, idx).end()
+                if text[idx:idx + 1] != ':':
+                    raise JSONDecodeError("Expecting ':' delimiter", text, idx)
+                idx = WHITESPACE.match(text, idx + 1).end()
+
+                validator_params = keys.properties.get(key)
+                if validator_params is None and keys.patterns is not None:
+                    for prop, pattern, params in keys.patterns:
+                        if pattern is not None and pattern.fullmatch(key):
+                            validator_params = params
+
+                if validator_params is not None:
+                    value[key], idx = await self._decode(text, idx, validator_params, path + (key,))
+                elif allow_unknown == self.validator.STRIP_UNKNOWN:
+                    _, idx = self._scan(text, idx, depth)
+                    stripped += 1
+                else:
+                    value[key], idx = self._scan(text, idx, depth)
+                    if allow_unknown is False:
+                        unknown.append(key)
+
+                idx = WHITESPACE.match(text, idx).end()
+                char = text[idx:idx + 1]
+                idx += 1
+                if char == '}':
+                    break
+                if char != ',':
+                    raise JSONDecodeError("Expecting ',' delimiter", text, idx - 1)
+                idx = WHITESPACE.match(text, idx).end()
+
+        # Declared properties, which are not in the object.
+        absent = keys.names.difference(value.keys())
+        if absent:
+            for prop in keys.properties:
+                if prop not in absent:
+                    continue
+                if prop in keys.required:
+                    self._add(path + (prop,), ValidationError(self.validator.ERROR_REQUIRED_FIELD))
+                elif prop in keys.defaults:
+                    value[prop] = keys.defaults[prop]
+
+        # Unknown keys are reported after the properties, as by `validate_object`.
+        if allow_unknown is False:
+            for key in unknown:
+                self._add(path + (key,), ValidationError(self.validator.ERROR_UNKNOWN_FIELD))
+
+        return value, idx
+
+    async def _decode_array(self, text: str, idx: int, schema: dict, path: tuple) -> tuple:
+        """
+        Parses and validates an array of objects or arrays, item by item.
+        """
+        items = schema['items']
+        maxlength = schema.get('maxlength')
+        unique = _UniqueIndexes(schema['unique_indexes']) if schema.get('unique_indexes') else None
+        start = len(self.issues)
+        stopped = False
+        value = []
+
+        idx = WHITESPACE.match(text, idx + 1).end()
+        if text[idx:idx + 1] == ']':
+            idx += 1
+        else:
+            while True:
+                if maxlength is not None and len(value) == maxlength:
+                    # The rest of the items is only parsed. As by `validate_array`, the issues of the items are
+                    # dropped.
+                    del self.issues.records[start:]
+                    self._add(path, ValidationError(self.validator.ERROR_MAX_LENGTH.format(maxlength)))
+                    maxlength, items, stopped = None, None, False
+
+                i = len(value)
+                if items is not None:
+                    count, nodes, item_idx = len(self.issues), self.nodes, idx
+                    try:
+                        item, idx = await self._decode(text, idx, items, path + (i,))
+
+                        # unique indexes, of the valid items
+                        if unique is not None and len(self.issues) == count:
+                            j = unique.add(i, item)
+                            if j is not None:
+                                self._add(path + (i,), ValidationError(self.validator.ERROR_NOT_UNIQUE.format(j)))
+                    except _Stop:
+                        if maxlength is None:
+                            raise
+                        # The array may still be too long, which drops the issues of its items, so the item and
+                        # the rest of the items are only parsed.
+                        stopped, items, self.nodes = True, None, nodes
+                        item, idx = self._scan(text, item_idx, len(path) + 2)
+                else:
+                    item, idx = self._scan(text, idx, len(path) + 2)
+                value.append(item)
+
+                idx = WHITESPACE.match(text, idx).end()
+                char = text[idx:idx + 1]
+                idx += 1
+                if char == ']':
+                    break
+                if char != ',':
+                    raise JSONDecodeError("Expecting ',' delimiter", text, idx - 1)
+                idx = WHITESPACE.match(text, idx).end()
+
+        if stopped:
+            raise _Stop()
+
+        # The checks of the whole array, the items are validated already. As by `validate_array`, the issues of the
+        # items are dropped if the array itself is invalid.
+        if items is not None:
+            params = {
+                key: param for key, param in schema.items()
+                if key not in ('type', 'items', 'required', 'unique_indexes', 'max_issues')
+            }
+            try:
+                value = await self.validator.validate_array(value, **params, strict_mode=self.strict_mode)
+            except ValidationError as e:
+                del self.issues.records[start:]
+                self._add(path, e)
+
+        return value, idx
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from codecs import getincrementaldecoder
+from inspect import isawaitable
+from tempfile import SpooledTemporaryFile
+
+__all__ = ['UploadedFile', 'sniff_content_type', 'iter_chunks', 'is_chunked']
+
+# Number of the first bytes, which are enough to sniff the content type.
+SNIFF_SIZE = 16
+
+# Size of the chunks, which are read from the file objects.
+CHUNK_SIZE = 64 * 1024
+
+# Content types, which are recognized by the signature at the beginning of the file.
+SIGNATURES = [
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'II*\x00', 'image/tiff'),
+    (b'MM\x00*', 'image/tiff'),
+    (b'%PDF-', 'application/pdf'),
+    (b'PK\x03\x04', 'application/zip'),
+    (b'\x1f\x8b', 'application/gzip'),
+    (b'OggS', 'audio/ogg'),
+    (b'fLaC', 'audio/flac'),
+    (b'ID3', 'audio/mpeg'),
+]
+
+
+def sniff_content_type(head: bytes) -> str:
+    """
+    Guesses the content type of a file by its first bytes.
+
+    Parameters
+    ----------
+    head : bytes
+        The first (at least `SNIFF_SIZE`, unless the file is shorter) bytes of the file.
+
+    Returns
+    -------
+    str
+    """
+    for signature, content_type in SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+
+    # The head may end in the middle of a multibyte character.
+    try:
+        text = getincrementaldecoder('utf-8')().decode(head)
+    except UnicodeDecodeError:
+        return 'application/octet-stream'
+
+    return 'application/octet-stream' if '\x00' in text else 'text/plain'
+
+
+def _file_object(value):
+    """
+    Returns the file object of the value, e.g. of `aiohttp.web.FileField`, or `None`.
+    """
+    if hasattr(value, 'read'):
+        return value
+
+    file = getattr(value, 'file', None)
+    return file if hasattr(file, 'read') else None
+
+
+def is_chunked(value) -> bool:
+    """
+    Checks if the value can be read in chunks by `iter_chunks`.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)) or hasattr(value, 'read_chunk') or hasattr(value, '__aiter__'):
+        return True
+    return _file_object(value) is not None
+
+
+async def iter_chunks(value):
+    """
+    Reads a file in chunks.
+
+    Parameters
+    ----------
+    value : bytes, bytearray, memoryview, object
+        Whole file, an object with a `read_chunk` coroutine method (such as `aiohttp.BodyPartReader`), an async
+        iterable of chunks, a file object with a `read` method, which may be a coroutine method, or an object with
+        a `file` attribute (such as `aiohttp.web.FileField`).
+
+    Yields
+    ------
+    bytes
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        yield value
+        return
+
+    # `aiohttp.BodyPartReader` reads the whole part at once, when it is iterated.
+    if hasattr(value, 'read_chunk'):
+        while True:
+            chunk = await value.read_chunk()
+            if not chunk:
+                return
+            yield chunk
+
+    if hasattr(value, '__aiter__'):
+        async for chunk in value:
+            yield chunk
+        return
+
+    file = _file_object(value)
+    while True:
+        chunk = file.read(CHUNK_SIZE)
+        if isawaitable(chunk):
+            chunk = await chunk
+        if not chunk:
+            return
+        yield chunk
+
+
+class UploadedFile:
+    """
+    Validated file, which content is spooled into memory (or to a temporary file, if it is large).
+
+    Parameters
+    ----------
+    filename : str, optional
+        ...
+    spool_size : int, optional
+        Maximum size of the content kept in memory.
+    """
+    __slots__ = ('file', 'filename', 'size', 'content_type', 'checksum')
+
+    def __init__(self, filename: str = None, spool_size: int = 1024 * 1024):
+        self.file = SpooledTemporaryFile(max_size=spool_size)
+        self.filename = filename
+        self.size = 0
+        self.content_type = None
+        self.checksum = None
+
+    def __repr__(self):
+        return '<UploadedFile filename={0!r} size={1} content_type={2!r}>'.format(
+            self.filename, self.size, self.content_type)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self.file.seek(offset, whence)
+
+    def close(self):
+        self.file.close()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+Built-in string formats.
+
+Each check uses the cheapest C implemented primitive for its format: addresses are parsed by `socket.inet_pton`, dates
+are sliced and looked up in the set of the days of a year, UUIDs are matched by a precompiled pattern of fixed character
+classes, and an ASCII host name or email address consists of the allowed characters only if deleting them by
+`bytes.translate` from its encoding leaves nothing. `benchmarks/bench_formats.py` compares them with precompiled regular
+expressions.
+
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from datetime import date, timedelta
+from socket import AF_INET, AF_INET6, inet_pton
+import re
+
+__all__ = ['FORMATS', 'is_uuid', 'is_email', 'is_ipv4', 'is_ipv6', 'is_date', 'is_hostname']
+
+UUID_PATTERN = re.compile('[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+# Days of a leap year in the form `MM-DD`.
+MONTH_DAYS = frozenset((date(2000, 1, 1) + timedelta(days=i)).strftime('%m-%d') for i in range(366))
+HOSTNAME_CHARS = b'0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-.'
+# Characters of the dot-atom local part of an email address (RFC 5322) and the `@`.
+EMAIL_CHARS = b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ!#$%&'*+-/=?^_`{|}~.@"
+
+
+def is_uuid(value: str) -> bool:
+    """
+    Checks if a string is a UUID in the canonical form, e.g. `123e4567-e89b-12d3-a456-426614174000`.
+    """
+    return UUID_PATTERN.fullmatch(value) is not None
+
+
+def is_ipv4(value: str) -> bool:
+    """
+    Checks if a string is an IPv4 address in the dotted decimal form, e.g. `192.168.0.1`.
+    """
+    try:
+        inet_pton(AF_INET, value)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def is_ipv6(value: str) -> bool:
+    """
+    Checks if a string is an IPv6 address, e.g. `2001:db8::1`.
+    """
+    try:
+        inet_pton(AF_INET6, value)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def is_date(value: str) -> bool:
+    """
+    Checks if a string is a full date (RFC 3339), e.g. `2018-02-28`.
+    """
+    # The days of the year are ASCII, so only the year has to be checked for other digits.
+    year, month_day = value[:4], value[5:]
+    if len(value) != 10 or value[4] != '-' or month_day not in MONTH_DAYS or not year.isdigit() or not year.isascii():
+        return False
+
+    if month_day == '02-29':
+        year = int(year)
+        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) and year != 0
+    return year != '0000'
+
+
+def is_hostname(value: str) -> bool:
+    """
+    Checks if a string is a host name (RFC 1123), e.g. `www.example.com`.
+    """
+    if not value or len(value) > 253 or not value.isascii() or value.encode().translate(None, HOSTNAME_CHARS):
+        return False
+
+    # The root label of a fully qualified name is empty.
+    if value[-1] == '.':
+        value = value[:-1]
+
+    # The labels are not empty and do not start or end with a hyphen.
+    if value == '' or value[0] in '-.' or value[-1] == '-':
+        return False
+    if '..' in value or '-.' in value or '.-' in value:
+        return False
+    return len(value) <= 63 or max(map(len, value.split('.'))) <= 63
+
+
+def is_email(value: str) -> bool:
+    """
+    Checks if a string is an email address with a dot-atom local part and a host name domain, e.g.
+    `user@example.com`.
+    """
+    local, _, domain = value.partition('@')
+
+    # The cheap structural checks go first. The characters of the domain are checked by the host name too, which
+    # rejects another `@`.
+    if not 0 < len(local) <= 64 or local[0] == '.' or local[-1] == '.' or '..' in local or '.' not in domain:
+        return False
+
+    return value.isascii() and not value.encode().translate(None, EMAIL_CHARS) and is_hostname(domain)
+
+
+# Check functions by format name.
+FORMATS = {
+    'uuid': is_uuid,
+    'email': is_email,
+    'ipv4': is_ipv4,
+    'ipv6': is_ipv6,
+    'date': is_date,
+    'hostname': is_hostname,
+}
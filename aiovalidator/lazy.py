@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from collections.abc import Mapping
+
+from .aiovalidator import ValidationError, Issues
+from .schema import run_sync
+
+__all__ = ['LazyObject']
+
+
+class LazyObject(Mapping):
+    """
+    Object, which properties are validated on first read.
+
+    It is returned by `Validator.validate_object` in the lazy mode, after the type, required and unknown keys have
+    been checked. Each validated property is cached, so it is validated once.
+
+    Parameters
+    ----------
+    validator : Validator
+        Validator, which validates the properties.
+    value : mapping
+        Object, defaults are already filled in.
+    properties : dict
+        Object properties, the regular expression properties are replaced with the object keys they match.
+    max_issues : int, optional
+        Maximum number of issues, which are collected by `resolve`.
+    strict_mode : bool, optional
+        Enables strict type checking.
+    """
+    __slots__ = ('_validator', '_value', '_properties', '_max_issues', '_strict_mode', '_validated')
+
+    def __init__(self, validator, value, properties: dict, *, max_issues: int = None, strict_mode: bool = True):
+        self._validator = validator
+        self._value = value
+        self._properties = properties
+        self._max_issues = max_issues
+        self._strict_mode = strict_mode
+        self._validated = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._validated[key]
+        except KeyError:
+            pass
+
+        value = self._value[key]
+        validator_params = self._properties.get(key)
+        if validator_params is None:
+            return value
+
+        # Properties are validated synchronously, asynchronous ones have to be resolved first.
+        try:
+            value = run_sync(self._validator._validate(value, **validator_params, strict_mode=self._strict_mode))
+        except ValidationError as e:
+            issues = Issues()
+            issues.extend((key,), e)
+            raise ValidationError(self._validator.ERROR_OBJECT_PROPERTIES, issues=issues)
+
+        self._validated[key] = value
+        return value
+
+    def __contains__(self, key):
+        # Membership does not validate the property, unlike the inherited one, which reads it.
+        return key in self._value
+
+    def __iter__(self):
+        return iter(self._value)
+
+    def __len__(self):
+        return len(self._value)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, self._value)
+
+    @property
+    def pending(self) -> list:
+        """
+        Properties, which are not validated yet.
+        """
+        return [key for key in self._value if key in self._properties and key not in self._validated]
+
+    async def resolve(self):
+        """
+        Validates the remaining properties, the validated values are written back to the object.
+
+        Returns
+        -------
+        mapping
+            The validated object.
+
+        Raises
+        ------
+        ValidationError
+            If any of the remaining properties is invalid.
+        """
+        issues = Issues()
+        limit = self._validator._limit(self._max_issues, self._validator.max_issues)
+
+        for key in self.pending:
+            if limit is not None and len(issues) >= limit:
+                issues.truncate(limit)
+                break
+
+            try:
+                self._validated[key] = await self._validator._validate(
+                    self._value[key], **self._properties[key], strict_mode=self._strict_mode)
+            except ValidationError as e:
+                issues.extend((key,), e)
+
+        if issues:
+            raise ValidationError(self._validator.ERROR_OBJECT_PROPERTIES, issues=issues)
+
+        self._value.update(self._validated)
+        return self._value
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+Optimization pass over the schemas.
+
+The checks of each `validate_*` method run in a fixed order and the first failed one is reported, so a check can be
+removed only if the checks before it imply it, i.e. it never fails. The pass removes such checks and replaces the
+constraints with cheaper equivalent ones, the reported errors stay the same.
+
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import re
+
+from .aiovalidator import Validator
+
+__all__ = ['optimize']
+
+
+def _frozen(allowed):
+    """
+    Returns the allowed values as a `frozenset`, so that they are looked up by hash, if all of them are hashable.
+    """
+    try:
+        return frozenset(allowed)
+    except TypeError:
+        return allowed
+
+
+def _optimize_string(schema: dict, validator: Validator):
+    # A string of a positive minimum length is not empty.
+    minlength = schema.get('minlength')
+    if minlength is not None and minlength <= 0:
+        del schema['minlength']
+    elif minlength is not None and not schema.get('empty', False):
+        schema['empty'] = True
+
+    allowed = schema.get('allowed')
+    if allowed is None:
+        return
+
+    # The regex and the format, which are checked after the allowed values, never fail if all of them match.
+    if all(isinstance(item, str) for item in allowed):
+        regex = schema.get('regex')
+        if regex is not None and all(re.match(regex, item) for item in allowed):
+            del schema['regex']
+
+        is_valid = validator.FORMATS.get(schema.get('format'))
+        if is_valid is not None and all(is_valid(item) for item in allowed):
+            del schema['format']
+
+    schema['allowed'] = _frozen(allowed)
+
+
+def _optimize_number(schema: dict, validator: Validator):
+    allowed = schema.get('allowed')
+    if allowed is None:
+        return
+
+    # The values out of the range fail the `min` or `max` check, which is before the allowed one.
+    min_value, max_value = schema.get('min'), schema.get('max')
+    try:
+        allowed = [
+            item for item in allowed
+            if not (min_value is not None and item < min_value) and not (max_value is not None and item > max_value)
+        ]
+    except TypeError:
+        pass
+
+    schema['allowed'] = _frozen(allowed)
+
+
+def _optimize_array(schema: dict, validator: Validator):
+    minlength = schema.get('minlength')
+    if minlength is not None and minlength <= 0:
+        del schema['minlength']
+
+    if schema.get('allowed') is not None:
+        schema['allowed'] = _frozen(schema['allowed'])
+
+
+# Optimizations by type, each one changes the schema in place.
+OPTIMIZATIONS = {
+    'string': _optimize_string,
+    'integer': _optimize_number,
+    'float': _optimize_number,
+    'number': _optimize_number,
+    'array': _optimize_array,
+}
+
+
+def optimize(schema: dict, validator: Validator) -> dict:
+    """
+    Returns a copy of the schema (without the nested ones), which is validated with the same errors by fewer or
+    cheaper checks.
+
+    Types, which are overridden or registered by the validator class, are not optimized, as their checks are unknown.
+    """
+    schema = dict(schema)
+    type_ = schema.get('type')
+
+    optimization = OPTIMIZATIONS.get(type_)
+    if optimization is not None and validator.get_type(type_) is Validator.get_type(type_):
+        optimization(schema, validator)
+
+    return schema
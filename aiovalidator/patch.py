@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from collections.abc import Mapping, MutableSequence
+from copy import deepcopy
+
+__all__ = ['PatchError', 'parse_pointer', 'apply_patch']
+
+
+class PatchError(ValueError):
+    """
+    Raised when a JSON Patch can not be applied to the document.
+    """
+
+
+def parse_pointer(pointer: str) -> tuple:
+    """
+    Splits a JSON Pointer (RFC 6901) into the path segments.
+
+    Parameters
+    ----------
+    pointer : str
+        JSON Pointer, e.g. `/items/0/title`.
+
+    Returns
+    -------
+    tuple
+    """
+    if pointer == '':
+        return ()
+
+    if not pointer.startswith('/'):
+        raise PatchError("invalid pointer '{0}'".format(pointer))
+
+    return tuple(segment.replace('~1', '/').replace('~0', '~') for segment in pointer[1:].split('/'))
+
+
+def _index(container, segment, pointer: str, *, append: bool = False) -> int:
+    if append and segment == '-':
+        return len(container)
+
+    try:
+        index = int(segment)
+    except ValueError:
+        raise PatchError("invalid array index in '{0}'".format(pointer))
+
+    if not 0 <= index < len(container) + append:
+        raise PatchError("array index out of range in '{0}'".format(pointer))
+
+    return index
+
+
+def _parent(document, path: tuple, pointer: str):
+    """
+    Returns the container of the value at the path.
+    """
+    node = document
+    for segment in path[:-1]:
+        try:
+            node = node[_index(node, segment, pointer) if isinstance(node, MutableSequence) else segment]
+        except (KeyError, TypeError):
+            raise PatchError("path '{0}' not found".format(pointer))
+
+    if not isinstance(node, (Mapping, MutableSequence)):
+        raise PatchError("path '{0}' not found".format(pointer))
+
+    return node
+
+
+def _get(document, pointer: str):
+    path = parse_pointer(pointer)
+    if not path:
+        return document
+
+    parent = _parent(document, path, pointer)
+    if isinstance(parent, MutableSequence):
+        return parent[_index(parent, path[-1], pointer)]
+
+    try:
+        return parent[path[-1]]
+    except KeyError:
+        raise PatchError("path '{0}' not found".format(pointer))
+
+
+def _add(document, pointer: str, value) -> tuple:
+    path = parse_pointer(pointer)
+    if not path:
+        raise PatchError("the whole document can not be replaced")
+
+    parent = _parent(document, path, pointer)
+    if isinstance(parent, MutableSequence):
+        parent.insert(_index(parent, path[-1], pointer, append=True), value)
+        # The indexes of the following items change, so the array is changed as a whole.
+        return path[:-1]
+
+    parent[path[-1]] = value
+    return path
+
+
+def _remove(document, pointer: str) -> tuple:
+    path = parse_pointer(pointer)
+    if not path:
+        raise PatchError("the whole document can not be removed")
+
+    parent = _parent(document, path, pointer)
+    if isinstance(parent, MutableSequence):
+        del parent[_index(parent, path[-1], pointer)]
+        return path[:-1]
+
+    try:
+        del parent[path[-1]]
+    except KeyError:
+        raise PatchError("path '{0}' not found".format(pointer))
+
+    return path
+
+
+def _replace(document, pointer: str, value) -> tuple:
+    path = parse_pointer(pointer)
+    if not path:
+        raise PatchError("the whole document can not be replaced")
+
+    parent = _parent(document, path, pointer)
+    if isinstance(parent, MutableSequence):
+        parent[_index(parent, path[-1], pointer)] = value
+    elif path[-1] in parent:
+        parent[path[-1]] = value
+    else:
+        raise PatchError("path '{0}' not found".format(pointer))
+
+    return path
+
+
+def _apply_operation(document, op: str, pointer: str, operation: dict) -> list:
+    paths = []
+
+    if op == 'add':
+        paths.append(_add(document, pointer, operation['value']))
+    elif op == 'remove':
+        paths.append(_remove(document, pointer))
+    elif op == 'replace':
+        paths.append(_replace(document, pointer, operation['value']))
+    elif op == 'move':
+        value = _get(document, operation['from'])
+        paths.append(_remove(document, operation['from']))
+        paths.append(_add(document, pointer, value))
+    elif op == 'copy':
+        paths.append(_add(document, pointer, deepcopy(_get(document, operation['from']))))
+    elif op == 'test':
+        if _get(document, pointer) != operation['value']:
+            raise PatchError("test failed at '{0}'".format(pointer))
+    else:
+        raise PatchError("unknown operation '{0}'".format(op))
+
+    return paths
+
+
+def apply_patch(document, operations: list) -> list:
+    """
+    Applies a JSON Patch (RFC 6902) to the document in place.
+
+    Parameters
+    ----------
+    document : dict
+        Document, to be patched.
+    operations : list
+        JSON Patch operations: `add`, `remove`, `replace`, `move`, `copy` and `test`.
+
+    Returns
+    -------
+    list
+        Paths (tuples of segments) of the changed values. Adding or removing an array item shifts the following
+        items, so the path of the array itself is returned, as the paths of earlier operations would be stale.
+    """
+    paths = []
+
+    for operation in operations:
+        try:
+            op, pointer = operation['op'], operation['path']
+        except (KeyError, TypeError):
+            raise PatchError("invalid operation {0!r}".format(operation))
+
+        try:
+            paths.extend(_apply_operation(document, op, pointer, operation))
+        except KeyError as e:
+            raise PatchError("missing '{0}' in operation {1!r}".format(e.args[0], operation))
+
+    return paths
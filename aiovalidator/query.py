@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from collections.abc import Mapping
+from datetime import datetime
+import re
+
+from .aiovalidator import Validator, ValidationError, Issues
+from .schema import run_sync
+
+__all__ = ['QuerySchema']
+
+# Returned by the coercion functions instead of raising an exception.
+INVALID = object()
+
+FLOAT_RE = re.compile(r'[+-]?((\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?|inf(inity)?|nan)', re.IGNORECASE)
+BOOLEANS = {'true': True, 'false': False}
+
+
+def to_string(value: str):
+    return value
+
+
+def to_integer(value: str):
+    digits = value[1:] if value[:1] in ('+', '-') else value
+    return int(value) if digits.isdigit() and digits.isascii() else INVALID
+
+
+def to_float(value: str):
+    return float(value) if FLOAT_RE.fullmatch(value) else INVALID
+
+
+def to_boolean(value: str):
+    return BOOLEANS.get(value.lower(), INVALID)
+
+
+class QuerySchema:
+    """
+    Compiled schema of a query string or form data, which values are strings.
+
+    Each property gets a coercion function from strings, chosen once by its type, which does not raise exceptions
+    on valid values. Repeated keys are collected into arrays, if the property is an array, and are not allowed
+    otherwise.
+
+    Parameters
+    ----------
+    schema : dict
+        Object schema: `{'type': 'object', 'properties': {...}, 'allow_unknown': False}`. The properties are strings,
+        numbers, booleans, datetimes or arrays of them.
+    validator : Validator, optional
+        Validator, which checks the constraints of the coerced values.
+    """
+    ERROR_MULTIPLE_VALUES = "multiple values not allowed"
+
+    # Coercion tables of the property types.
+    COERCIONS = {
+        'string': to_string,
+        'integer': to_integer,
+        'float': to_float,
+        'number': to_float,
+        'boolean': to_boolean,
+    }
+
+    # Type names in the error messages, as the validators report them.
+    TYPE_NAMES = {'number': 'int or float'}
+
+    def __init__(self, schema: dict, validator: Validator = None):
+        self.validator = Validator() if validator is None else validator
+        self.allow_unknown = schema.get('allow_unknown', False)
+        self.fields = [self._compile(prop, params) for prop, params in (schema.get('properties') or {}).items()]
+        self.keys = frozenset(field[0] for field in self.fields)
+
+    def _compile(self, prop: str, params: dict) -> tuple:
+        """
+        Returns the coercion table entry of a property: its name, whether it is an array, the coercion function, the
+        item validator with its params, the array params, whether it is required and its default.
+        """
+        params = dict(params)
+        required = params.pop('required', True)
+        default = params.get('default', INVALID)
+        type_ = params.pop('type')
+
+        is_array = type_ == 'array'
+        array_params = None
+        if is_array:
+            array_params = params
+            params = dict(array_params.pop('items', None) or {'type': 'string'})
+            type_ = params.pop('type')
+            params.pop('required', None)
+
+        if type_ == 'datetime':
+            coerce = self._to_datetime(params['format'])
+        elif type_ in self.COERCIONS:
+            coerce = self.COERCIONS[type_]
+        else:
+            raise ValueError("type '{0}' of '{1}' is not supported in query strings".format(type_, prop))
+
+        validate = getattr(self.validator, 'validate_{type}'.format(type=type_))
+
+        return prop, is_array, coerce, type_, validate, params, array_params, required, default
+
+    @staticmethod
+    def _to_datetime(format: str):
+        def to_datetime(value: str):
+            try:
+                return datetime.strptime(value, format)
+            except ValueError:
+                return INVALID
+
+        return to_datetime
+
+    def validate(self, value) -> dict:
+        """
+        Validates a query string or form data.
+
+        Parameters
+        ----------
+        value : Mapping
+            A `MultiDict`-like mapping with `getall`, or a mapping of strings or lists of strings (as returned by
+            `urllib.parse.parse_qs`).
+
+        Returns
+        -------
+        dict
+        """
+        if not isinstance(value, Mapping):
+            raise ValidationError(Validator.ERROR_BAD_TYPE.format('object'))
+
+        getall = getattr(value, 'getall', None)
+        result = {}
+        issues = Issues()
+
+        for prop, is_array, coerce, type_, validate, params, array_params, required, default in self.fields:
+            if prop not in value:
+                values = ()
+            elif getall is not None:
+                values = getall(prop)
+            else:
+                values = value[prop]
+                if not isinstance(values, (list, tuple)):
+                    values = (values,)
+
+            # An empty list of values is the same as a missing key.
+            if not values:
+                if required:
+                    issues.add((prop,), Validator.ERROR_REQUIRED_FIELD)
+                elif default is not INVALID:
+                    result[prop] = default
+                continue
+
+            if not is_array and len(values) > 1:
+                issues.add((prop,), self.ERROR_MULTIPLE_VALUES)
+                continue
+
+            items = []
+            item_issues = Issues()
+            for i, item in enumerate(values):
+                coerced = coerce(item) if isinstance(item, str) else item
+                if coerced is INVALID:
+                    item_issues.add((i,), Validator.ERROR_BAD_TYPE.format(self.TYPE_NAMES.get(type_, type_)))
+                    continue
+
+                # The coerced values have the right type, so only the constraints are checked.
+                try:
+                    items.append(validate(coerced, **params, strict_mode=True))
+                except ValidationError as e:
+                    item_issues.extend((i,), e)
+
+            if not is_array:
+                if item_issues:
+                    issues.add((prop,), item_issues.records[0][1])
+                else:
+                    result[prop] = items[0]
+                continue
+
+            if item_issues:
+                issues.extend((prop,), ValidationError(Validator.ERROR_ARRAY_ITEMS, issues=item_issues))
+                continue
+
+            try:
+                result[prop] = run_sync(self.validator.validate_array(items, **array_params, strict_mode=True))
+            except ValidationError as e:
+                issues.extend((prop,), e)
+
+        # unknown, in the query order, the keys of a multidict are repeated
+        if not self.allow_unknown:
+            for key in dict.fromkeys(value.keys()):
+                if key not in self.keys:
+                    issues.add((key,), Validator.ERROR_UNKNOWN_FIELD)
+
+        if issues:
+            raise ValidationError(Validator.ERROR_OBJECT_PROPERTIES, issues=issues)
+
+        return result
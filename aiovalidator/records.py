@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+__all__ = ['Record', 'make_record_class']
+
+
+class Record:
+    """
+    Base class of the validated objects, which properties are stored in `__slots__` instead of a dict.
+
+    Subclasses are generated per object schema by `make_record_class`.
+    """
+    __slots__ = ()
+
+    # Names of the properties and their default values, in the schema order.
+    _fields = ()
+    _defaults = ()
+
+    def __init__(self, **kwargs):
+        for field, default in self._defaults:
+            setattr(self, field, kwargs.pop(field, default))
+
+        if kwargs:
+            raise TypeError("unknown fields {0}".format(sorted(kwargs)))
+
+    @classmethod
+    def from_dict(cls, value) -> 'Record':
+        """
+        Returns a record of the mapping values, missing properties get their default values.
+        """
+        record = cls.__new__(cls)
+        for field, default in cls._defaults:
+            setattr(record, field, value.get(field, default))
+
+        return record
+
+    def to_dict(self) -> dict:
+        """
+        Returns the properties as a dict, nested records are converted as well.
+        """
+        result = {}
+        for field in self._fields:
+            value = getattr(self, field)
+            if isinstance(value, Record):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [item.to_dict() if isinstance(item, Record) else item for item in value]
+            result[field] = value
+
+        return result
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(getattr(self, field) == getattr(other, field) for field in self._fields)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, ', '.join(
+            '{0}={1!r}'.format(field, getattr(self, field)) for field in self._fields))
+
+
+def make_record_class(name: str, properties: dict) -> type:
+    """
+    Generates a record class for an object schema.
+
+    Parameters
+    ----------
+    name : str
+        Class name.
+    properties : dict
+        Object properties, their names must be identifiers, which do not start with an underscore and are not
+        attributes of `Record`, e.g. `to_dict`. Optional properties default to the schema `default`, or to `None` if
+        it is not given.
+
+    Returns
+    -------
+    type
+    """
+    for prop in properties:
+        if not isinstance(prop, str) or not prop.isidentifier() or prop.startswith('_') or hasattr(Record, prop):
+            raise ValueError("property '{0}' can not be a record field".format(prop))
+
+    fields = tuple(properties)
+    defaults = tuple((prop, properties[prop].get('default')) for prop in fields)
+
+    return type(name, (Record,), {'__slots__': fields, '_fields': fields, '_defaults': defaults})
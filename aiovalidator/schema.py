@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+import os
+
+from .aiovalidator import Validator, ValidationError
+from .records import make_record_class
+from .optimizer import optimize
+
+__all__ = ['Schema']
+
+
+def run_sync(coroutine):
+    """
+    Runs a coroutine, which never suspends, without an event loop.
+
+    Raises
+    ------
+    RuntimeError
+        If the coroutine suspends, i.e. it awaits a real asynchronous operation.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as e:
+        return e.value
+
+    coroutine.close()
+    raise RuntimeError("the validation has suspended, asynchronous validators require an event loop")
+
+
+class Schema:
+    """
+    Compiled schema.
+
+    The schema is checked and copied into read-only mappings and tuples once, record classes are generated up front
+    and the key sets of the objects are computed by the validator up front. Validation does not change the schema, it
+    only fills the caches of the validator, which are safe to use concurrently, so a compiled schema is safe to share
+    across threads and tasks, as long as the validator is not changed.
+
+    Parameters
+    ----------
+    schema : dict
+        Schema, e.g. `{'type': 'object', 'properties': {...}}`.
+    validator : Validator, optional
+        Validator, which validates the values.
+    optimize : bool, optional
+        Removes redundant checks and replaces constraints with cheaper equivalent ones, see `optimizer.optimize`.
+    """
+    __slots__ = ('validator', 'schema', '_optimize')
+
+    def __init__(self, schema: dict, validator: Validator = None, optimize: bool = True):
+        self.validator = Validator() if validator is None else validator
+        self._optimize = optimize
+        self.schema = self._compile(schema)
+
+    def __repr__(self):
+        return 'Schema({0!r})'.format(self.schema)
+
+    # Schema keywords, which lists are copied into tuples.
+    LIST_KEYWORDS = frozenset(('allowed', 'unique_indexes', 'content_types'))
+
+    def _compile(self, schema: dict) -> MappingProxyType:
+        """
+        Returns a read-only copy of the schema, nested schemas are compiled as well.
+        """
+        if self.validator.get_type(schema.get('type')) is None:
+            raise ValueError("unknown type '{0}'".format(schema.get('type')))
+
+        compiled = dict(schema)
+
+        for keyword in self.LIST_KEYWORDS.intersection(schema):
+            if compiled[keyword] is not None:
+                compiled[keyword] = tuple(tuple(item) if isinstance(item, list) else item
+                                          for item in compiled[keyword])
+
+        # properties
+        if schema.get('properties') is not None:
+            compiled['properties'] = MappingProxyType({
+                prop: self._compile(validator_params) for prop, validator_params in schema['properties'].items()
+            })
+
+        # items
+        if schema.get('items') is not None:
+            compiled['items'] = self._compile(schema['items'])
+
+        # Record classes are generated once, instead of looking them up on each validation.
+        if schema.get('record') is True:
+            compiled['record'] = make_record_class('Record', compiled.get('properties') or {})
+
+        if self._optimize:
+            compiled = optimize(compiled, self.validator)
+
+        # The key sets are cached by the validator up front, rather than on the first validation.
+        if compiled.get('properties') is not None:
+            self.validator._object_keys(compiled['properties'])
+
+        return MappingProxyType(compiled)
+
+    async def validate(self, value, *, strict_mode: bool = True):
+        """
+        Validates a value.
+
+        Parameters
+        ----------
+        value : any
+            Value, to be validated.
+        strict_mode : bool, optional
+            Enables strict type checking.
+
+        Returns
+        -------
+        any
+        """
+        return await self.validator.validate(value, **self.schema, strict_mode=strict_mode)
+
+    async def validate_json(self, raw, *, strict_mode: bool = True):
+        """
+        Parses a JSON document and validates it in a single pass, see `Validator.validate_json`.
+
+        Parameters
+        ----------
+        raw : str, bytes, bytearray, memoryview
+            JSON document.
+        strict_mode : bool, optional
+            Enables strict type checking.
+
+        Returns
+        -------
+        any
+        """
+        return await self.validator.validate_json(raw, schema=self.schema, strict_mode=strict_mode)
+
+    def validate_sync(self, value, *, strict_mode: bool = True):
+        """
+        Validates a value without an event loop, it is possible unless the schema has asynchronous validators.
+
+        Parameters
+        ----------
+        value : any
+            Value, to be validated.
+        strict_mode : bool, optional
+            Enables strict type checking.
+
+        Returns
+        -------
+        any
+        """
+        return run_sync(self.validate(value, strict_mode=strict_mode))
+
+    def validate_many(self, values: list, *, executor=None, max_workers: int = None, return_exceptions: bool = False,
+                      strict_mode: bool = True) -> list:
+        """
+        Validates a batch of values in a thread pool, each thread validates a contiguous slice of the values.
+
+        All the built-in validators are CPU-bound, so the batch scales with the threads on free-threaded builds of
+        CPython only.
+
+        Parameters
+        ----------
+        values : list
+            Values, to be validated.
+        executor : concurrent.futures.Executor, optional
+            Executor, by default a temporary thread pool is used.
+        max_workers : int, optional
+            Number of the slices, by default the number of CPUs.
+        return_exceptions : bool, optional
+            Returns validation errors in place of the invalid values, instead of raising the first one.
+        strict_mode : bool, optional
+            Enables strict type checking.
+
+        Returns
+        -------
+        list
+        """
+        values = list(values)
+        max_workers = max_workers or os.cpu_count() or 1
+        size = -(-len(values) // max_workers) or 1
+        slices = [values[i:i + size] for i in range(0, len(values), size)]
+
+        def validate_slice(values):
+            results = []
+            for value in values:
+                try:
+                    results.append(self.validate_sync(value, strict_mode=strict_mode))
+                except ValidationError as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+            return results
+
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return [result for results in executor.map(validate_slice, slices) for result in results]
+
+        return [result for results in executor.map(validate_slice, slices) for result in results]
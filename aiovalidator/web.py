@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+Request validation for `aiohttp` handlers.
+
+Usage::
+
+    @validate_request(body={'type': 'object', 'properties': {...}}, match_info={...})
+    async def handler(request):
+        body = request['body']
+
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from functools import wraps
+import json
+
+from aiohttp import web
+
+from .aiovalidator import Validator, ValidationError, Issues
+from .query import QuerySchema
+from .schema import Schema
+
+__all__ = ['RequestSchema', 'validate_request', 'error_response']
+
+
+class RequestSchema:
+    """
+    Compiled schemas of the parts of a request.
+
+    Parameters
+    ----------
+    body : dict, optional
+        Schema of the JSON body.
+    query : dict, optional
+        Schema of the query string, its values are coerced from strings and repeated keys are collected into arrays.
+    match_info : dict, optional
+        Schema of the route variables, their values are coerced from strings.
+    validator : Validator, optional
+        Validator, which validates the requests.
+    loads : callable, optional
+        JSON decoder.
+    """
+    ERROR_BAD_JSON = "invalid JSON"
+
+    def __init__(self, *, body: dict = None, query: dict = None, match_info: dict = None, validator: Validator = None,
+                 loads=json.loads):
+        validator = Validator() if validator is None else validator
+        self.body = Schema(body, validator) if body is not None else None
+        self.query = QuerySchema(query, validator) if query is not None else None
+        self.match_info = Schema(match_info, validator) if match_info is not None else None
+        self.loads = loads
+
+    async def validate(self, request: web.Request) -> dict:
+        """
+        Reads and validates the request, all the parts are validated before an error is raised.
+
+        Returns
+        -------
+        dict
+            Validated parts of the request: `body`, `query` and `match_info`.
+        """
+        issues = Issues()
+        result = {}
+
+        if self.query is not None:
+            try:
+                result['query'] = self.query.validate(request.query)
+            except ValidationError as e:
+                issues.extend(('query',), e)
+
+        for name, schema, strict_mode in (('match_info', self.match_info, False), ('body', self.body, True)):
+            if schema is None:
+                continue
+
+            try:
+                result[name] = await schema.validate(await self._read(request, name), strict_mode=strict_mode)
+            except ValidationError as e:
+                issues.extend((name,), e)
+
+        if issues:
+            raise ValidationError(Validator.ERROR_OBJECT_PROPERTIES, issues=issues)
+
+        return result
+
+    async def _read(self, request: web.Request, name: str):
+        """
+        Reads a part of the request.
+        """
+        if name == 'match_info':
+            return dict(request.match_info)
+
+        # The body is read and decoded once.
+        raw = await request.read()
+        if not raw:
+            return None
+
+        try:
+            return self.loads(raw)
+        except ValueError:
+            raise ValidationError(self.ERROR_BAD_JSON)
+
+
+def error_response(error: ValidationError, status: int = 422) -> web.Response:
+    """
+    Returns a JSON response with the validation error and its issues.
+    """
+    return web.json_response({'error': error.msg, 'issues': error.issues}, status=status)
+
+
+def validate_request(*, body: dict = None, query: dict = None, match_info: dict = None, validator: Validator = None,
+                     loads=json.loads):
+    """
+    Decorator of `aiohttp` handlers, which validates the request against the schemas compiled once, at startup.
+
+    The validated parts are stored in the request as `request['body']`, `request['query']` and
+    `request['match_info']`. An invalid request gets a `422` response with the issues.
+
+    Parameters
+    ----------
+    body : dict, optional
+        Schema of the JSON body.
+    query : dict, optional
+        Schema of the query string.
+    match_info : dict, optional
+        Schema of the route variables.
+    validator : Validator, optional
+        Validator, which validates the requests.
+    loads : callable, optional
+        JSON decoder.
+    """
+    schema = RequestSchema(body=body, query=query, match_info=match_info, validator=validator, loads=loads)
+
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(request: web.Request):
+            try:
+                request.update(await schema.validate(request))
+            except ValidationError as e:
+                return error_response(e)
+
+            return await handler(request)
+
+        wrapper.request_schema = schema
+
+        return wrapper
+
+    return decorator
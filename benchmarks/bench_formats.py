@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+Compares the built-in string formats with the equivalent regular expressions.
+
+Each format check is measured against the match of a precompiled pattern and against the check of the `regex` keyword
+of `validate_string`, which compiles (a cache lookup) and matches the pattern per value, that is how the formats were
+expressed before. The rest of `validate_string` is the same for all of them. The checks are measured in interleaved
+rounds and the best round is reported, which is stable on a noisy machine.
+
+Usage::
+
+    python benchmarks/bench_formats.py --repeat 200
+
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import argparse
+import re
+import timeit
+
+from aiovalidator.formats import FORMATS
+
+_IPV4 = r'(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}'
+_H16 = r'[0-9a-fA-F]{1,4}'
+_LS32 = r'(' + _H16 + ':' + _H16 + '|' + _IPV4 + ')'
+_LABEL = r'[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?'
+_HOSTNAME = r'(?=.{1,253}\.?$)' + _LABEL + r'(\.' + _LABEL + r')*\.?'
+_ATOM = r"[a-zA-Z0-9!#$%&'*+/=?^_`{|}~-]+"
+_EMAIL = r'(?=[^@]{1,64}@)' + _ATOM + r'(\.' + _ATOM + r')*@(?=[^@]*\.[^@]*$)' + _HOSTNAME
+_IPV6 = '|'.join([
+    '(' + _H16 + ':){6}' + _LS32,
+    '::(' + _H16 + ':){5}' + _LS32,
+    '(' + _H16 + ')?::(' + _H16 + ':){4}' + _LS32,
+    '((' + _H16 + ':){0,1}' + _H16 + ')?::(' + _H16 + ':){3}' + _LS32,
+    '((' + _H16 + ':){0,2}' + _H16 + ')?::(' + _H16 + ':){2}' + _LS32,
+    '((' + _H16 + ':){0,3}' + _H16 + ')?::' + _H16 + ':' + _LS32,
+    '((' + _H16 + ':){0,4}' + _H16 + ')?::' + _LS32,
+    '((' + _H16 + ':){0,5}' + _H16 + ')?::' + _H16,
+    '((' + _H16 + ':){0,6}' + _H16 + ')?::',
+])
+
+# Regular expressions, which accept the same strings as the formats.
+REGEXES = {
+    'uuid': r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}',
+    'email': _EMAIL,
+    'ipv4': _IPV4,
+    'ipv6': '(' + _IPV6 + ')',
+    'date': r'\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])',
+    'hostname': _HOSTNAME,
+}
+
+SAMPLES = {
+    'uuid': ['123e4567-e89b-12d3-a456-426614174000', '123e4567-e89b-12d3-a456-42661417400g'],
+    'email': ['first.last+tag@mail.example.com', 'first..last@example.com'],
+    'ipv4': ['192.168.100.200', '192.168.100.256'],
+    'ipv6': ['2001:db8:85a3::8a2e:370:7334', '2001:db8:85a3::8a2e::7334'],
+    'date': ['2018-02-28', '2018-02-3x'],
+    'hostname': ['api.eu-west-1.example.com', 'api.eu_west_1.example.com'],
+}
+
+
+def measure(funcs: list, samples: list, number: int, repeat: int) -> list:
+    """
+    Returns the best times of the checks in nanoseconds, they are measured in turns.
+    """
+    def runner(func):
+        def run():
+            for sample in samples:
+                func(sample)
+        return run
+
+    runs = [runner(func) for func in funcs]
+    best = [float('inf')] * len(funcs)
+    for _ in range(repeat):
+        for i, run in enumerate(runs):
+            best[i] = min(best[i], timeit.timeit(run, number=number))
+
+    return [time / number / len(samples) * 1e9 for time in best]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=2000, help='number of checks of each sample per round')
+    parser.add_argument('--repeat', type=int, default=200, help='number of rounds, the best one is reported')
+    args = parser.parse_args()
+
+    print('{0:<10} {1:>10} {2:>11} {3:>10} {4:>10} {5:>10}'.format(
+        'format', 'format, ns', 'pattern, ns', 'vs pattern', 'regex, ns', 'vs regex'))
+    for name, samples in SAMPLES.items():
+        is_valid = FORMATS[name]
+        regex = '^' + REGEXES[name] + '$'
+        pattern = re.compile(REGEXES[name])
+
+        # Both checks must agree on the samples.
+        for sample in samples:
+            assert is_valid(sample) is (pattern.fullmatch(sample) is not None), (name, sample)
+
+        timings = measure([is_valid, pattern.fullmatch, lambda value: re.compile(regex).match(value)], samples,
+                          args.number, args.repeat)
+        print('{0:<10} {1:>10.0f} {2:>11.0f} {3:>9.2f}x {4:>10.0f} {5:>9.2f}x'.format(
+            name, timings[0], timings[1], timings[1] / timings[0], timings[2], timings[2] / timings[0]))
+
+
+if __name__ == '__main__':
+    main()
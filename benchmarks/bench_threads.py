@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+Measures the batch validation of a compiled schema with different numbers of threads.
+
+On free-threaded builds of CPython the throughput should grow with the threads, on builds with the GIL it should
+stay close to the sequential one.
+
+Usage::
+
+    python benchmarks/bench_threads.py --values 20000 --threads 1 2 4 8
+
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import argparse
+import sys
+import time
+
+from aiovalidator import Validator
+
+SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'id': {'type': 'integer', 'min': 1},
+        'title': {'type': 'string', 'maxlength': 100},
+        'price': {'type': 'number', 'min': 0},
+        'tags': {'type': 'array', 'items': {'type': 'string'}},
+        'sizes': {'type': 'object', 'properties': {'^[a-z]+$': {'type': 'integer'}}},
+    }
+}
+
+
+def make_values(count: int) -> list:
+    return [
+        {'id': i, 'title': 'item {0}'.format(i), 'price': i * 1.5, 'tags': ['a', 'b', 'c'], 'sizes': {'s': 1, 'm': 2}}
+        for i in range(1, count + 1)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--values', type=int, default=20000, help='number of values in the batch')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8], help='numbers of threads')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs, the best one is reported')
+    args = parser.parse_args()
+
+    schema = Validator().compile(SCHEMA)
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python {0}, GIL {1}'.format(sys.version.split()[0], 'enabled' if gil else 'disabled'))
+
+    # sequential
+    best = float('inf')
+    for _ in range(0, args.repeat):
+        values = make_values(args.values)
+        started = time.perf_counter()
+        for value in values:
+            schema.validate_sync(value)
+        best = min(best, time.perf_counter() - started)
+    baseline = best
+    print('{0:>12}: {1:>10.0f} values/s'.format('sequential', args.values / best))
+
+    # threads
+    for threads in args.threads:
+        best = float('inf')
+        for _ in range(0, args.repeat):
+            values = make_values(args.values)
+            started = time.perf_counter()
+            schema.validate_many(values, max_workers=threads)
+            best = min(best, time.perf_counter() - started)
+        print('{0:>12}: {1:>10.0f} values/s, x{2:.2f}'.format(
+            '{0} threads'.format(threads), args.values / best, baseline / best))
+
+
+if __name__ == '__main__':
+    main()
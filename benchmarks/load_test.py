@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+Runs concurrent validation tasks on a local event loop and measures their throughput, latency and event loop lag.
+
+Each of the `--tasks` tasks validates payloads one after another until `--requests` payloads are validated in total,
+the latency of a request is the time from its start to its end. Every request validates its own copy of the payload,
+the copy is not included in the latency. Every run gets a new event loop. The lag is measured by a monitor task, which sleeps
+for `--lag-interval` and records how late it is woken up, i.e. how long the loop has been blocked.
+
+The modes are:
+
+- inline: `Validator.validate` runs in the task, blocking the loop for the whole payload;
+- offloaded: `Schema.validate_sync` runs in a thread pool of `--workers` threads;
+- cooperative: `Validator.validate` yields to the loop after every `--yield-every` values.
+
+Usage::
+
+    python benchmarks/load_test.py --tasks 100 --requests 2000 --shapes flat array --modes inline cooperative
+
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+import argparse
+import asyncio
+import time
+
+from aiovalidator import Validator
+
+ITEM = {
+    'type': 'object',
+    'properties': {
+        'id': {'type': 'integer', 'min': 1},
+        'title': {'type': 'string', 'maxlength': 100},
+        'price': {'type': 'number', 'min': 0},
+        'tags': {'type': 'array', 'items': {'type': 'string'}},
+    }
+}
+
+
+def flat(size: int) -> tuple:
+    """
+    Object with `size` scalar properties.
+    """
+    schema = {'type': 'object', 'properties': {'p{0}'.format(i): {'type': 'string'} for i in range(size)}}
+    return schema, {'p{0}'.format(i): 'value {0}'.format(i) for i in range(size)}
+
+
+def nested(size: int) -> tuple:
+    """
+    Objects nested `size` levels deep, each one with an item.
+    """
+    schema, payload = ITEM, {'id': 1, 'title': 'item', 'price': 1.5, 'tags': ['a']}
+    for _ in range(size):
+        schema = {'type': 'object', 'properties': {'item': ITEM, 'child': schema}}
+        payload = {'item': {'id': 1, 'title': 'item', 'price': 1.5, 'tags': ['a']}, 'child': payload}
+    return schema, payload
+
+
+def array(size: int) -> tuple:
+    """
+    Array of `size` objects.
+    """
+    payload = [{'id': i, 'title': 'item {0}'.format(i), 'price': i * 1.5, 'tags': ['a', 'b']} for i in range(1, size + 1)]
+    return {'type': 'array', 'items': ITEM}, payload
+
+
+def numbers(size: int) -> tuple:
+    """
+    Array of `size` integers, which is checked in bulk.
+    """
+    return {'type': 'array', 'items': {'type': 'integer', 'min': 0}}, list(range(size))
+
+
+SHAPES = {'flat': flat, 'nested': nested, 'array': array, 'numbers': numbers}
+
+
+class CooperativeValidator(Validator):
+    """
+    Validator, which yields to the event loop after every `yield_every` values.
+    """
+    yield_every = 100
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._count = 0
+
+    async def _validate(self, value, **kwargs):
+        self._count += 1
+        if self._count % self.yield_every == 0:
+            await asyncio.sleep(0)
+
+        return await super()._validate(value, **kwargs)
+
+
+def percentile(values: list, p: float) -> float:
+    """
+    Returns the percentile of sorted values.
+    """
+    if not values:
+        return float('nan')
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+async def monitor_lag(interval: float, lags: list, stop: asyncio.Event):
+    """
+    Records how late the monitor is woken up after each sleep.
+    """
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def run(mode: str, schema: dict, payload, args) -> dict:
+    """
+    Validates the payloads by the concurrent tasks, returns the measurements.
+    """
+    loop = asyncio.get_running_loop()
+    if mode == 'cooperative':
+        CooperativeValidator.yield_every = args.yield_every
+        validator = CooperativeValidator()
+    else:
+        validator = Validator()
+    compiled = validator.compile(schema)
+
+    if mode == 'offloaded':
+        executor = ThreadPoolExecutor(max_workers=args.workers)
+
+        async def validate(value):
+            await loop.run_in_executor(executor, compiled.validate_sync, value)
+    else:
+        executor = None
+
+        async def validate(value):
+            await compiled.validate(value)
+
+    latencies = []
+    remaining = [args.requests]
+
+    async def worker():
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            # The validation normalizes the payload in place, so every request gets its own copy.
+            value = deepcopy(payload)
+            started = time.perf_counter()
+            await validate(value)
+            latencies.append(time.perf_counter() - started)
+
+    lags = []
+    stop = asyncio.Event()
+    monitor = asyncio.ensure_future(monitor_lag(args.lag_interval, lags, stop))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.tasks)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await monitor
+    if executor is not None:
+        executor.shutdown()
+
+    latencies.sort()
+    lags.sort()
+    return {
+        'throughput': len(latencies) / elapsed,
+        'p50': percentile(latencies, 50),
+        'p99': percentile(latencies, 99),
+        'lag_p50': percentile(lags, 50),
+        'lag_p99': percentile(lags, 99),
+        'lag_max': lags[-1] if lags else float('nan'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--tasks', type=int, default=100, help='number of concurrent tasks')
+    parser.add_argument('--requests', type=int, default=2000, help='number of payloads validated per run')
+    parser.add_argument('--shapes', nargs='+', choices=sorted(SHAPES), default=['flat', 'nested', 'array', 'numbers'],
+                        help='payload shapes')
+    parser.add_argument('--size', type=int, default=100, help='size of the payloads: properties, levels or items')
+    parser.add_argument('--modes', nargs='+', choices=['inline', 'offloaded', 'cooperative'],
+                        default=['inline', 'offloaded', 'cooperative'], help='validation modes')
+    parser.add_argument('--workers', type=int, default=4, help='number of threads of the offloaded mode')
+    parser.add_argument('--yield-every', type=int, default=100, help='number of values between the yields')
+    parser.add_argument('--lag-interval', type=float, default=0.005, help='sleep interval of the lag monitor, s')
+    args = parser.parse_args()
+
+    print('{0} tasks, {1} requests, size {2}'.format(args.tasks, args.requests, args.size))
+    print('{0:<8} {1:<12} {2:>10} {3:>9} {4:>9} {5:>9} {6:>9} {7:>9}'.format(
+        'shape', 'mode', 'req/s', 'p50, ms', 'p99, ms', 'lag p50', 'lag p99', 'lag max'))
+
+    for shape in args.shapes:
+        schema, payload = SHAPES[shape](args.size)
+        for mode in args.modes:
+            result = asyncio.run(run(mode, schema, payload, args))
+            print('{0:<8} {1:<12} {2:>10.0f} {3:>9.2f} {4:>9.2f} {5:>9.2f} {6:>9.2f} {7:>9.2f}'.format(
+                shape, mode, result['throughput'], result['p50'] * 1000, result['p99'] * 1000,
+                result['lag_p50'] * 1000, result['lag_p99'] * 1000, result['lag_max'] * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -8,4 +8,9 @@ setup(name='aiovalidator',
       author_email='vladimir@kozlovskilab.com',
       license='MIT',
       packages=['aiovalidator'],
+      python_requires='>=3.7',
+      extras_require={
+          'aiohttp': ['aiohttp'],
+          'numpy': ['numpy'],
+      },
       zip_safe=False)
@@ -11,9 +11,16 @@
 :Authors:
     - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
 """
+from array import array
+from collections import OrderedDict, UserList
+from enum import IntEnum
+import asyncio
+import hashlib
+import io
+
 import pytest
 
-from aiovalidator import Validator, ValidationError
+from aiovalidator import Validator, ValidationError, ValidationTimeout, Issues
 
 
 class TestValidator:
@@ -722,6 +729,57 @@ class TestValidator:
                                                                      default=None, nullable=False, allow_unknown=True,
                                                                      strict_mode=True)
 
+    async def test_validate_object_strip_unknown(self, validator):
+        properties = {'a': {'type': 'integer'}, '^x_\\d$': {'type': 'string'},
+                      'b': {'type': 'integer', 'required': False, 'default': 0}}
+        value = {'a': 1, 'x_1': 'x', 'y': 2, 'z': {'nested': True}}
+        result = await validator.validate_object(value, properties=properties, allow_unknown=validator.STRIP_UNKNOWN)
+        assert result == {'a': 1, 'x_1': 'x', 'b': 0}
+        assert value == {'a': 1, 'x_1': 'x', 'y': 2, 'z': {'nested': True}}
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_object({'a': 'a', 'y': 2}, properties=properties, allow_unknown='strip')
+        assert exc_info.value.issues == {'a': validator.ERROR_BAD_TYPE.format('integer')}
+
+        record = await validator.validate_object({'a': 1, 'y': 2}, properties={'a': {'type': 'integer'}},
+                                                 allow_unknown='strip', record=True)
+        assert record.to_dict() == {'a': 1}
+
+        schema = {'type': 'array', 'items': {'type': 'object', 'properties': properties, 'allow_unknown': 'strip'}}
+        assert [{'a': 1, 'b': 0}] == await validator.validate_json('[{"a": 1, "y": [2]}]', schema=schema)
+
+    async def test_validate_object_key_sets(self, validator):
+        properties = {
+            'a': {'type': 'integer'},
+            '^x_\\d$': {'type': 'string'},
+            'b': {'type': 'integer', 'required': False, 'default': 0},
+            'c': {'type': 'integer'},
+        }
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_object({'z': 1, 'x_1': 'x', 'a': 'a', 'y': 2}, properties=properties)
+        assert list(exc_info.value.records) == [
+            (('a',), validator.ERROR_BAD_TYPE.format('integer')),
+            (('c',), validator.ERROR_REQUIRED_FIELD),
+            (('z',), validator.ERROR_UNKNOWN_FIELD),
+            (('y',), validator.ERROR_UNKNOWN_FIELD),
+        ]
+
+        value = await validator.validate_object({'c': 3, 'x_2': 'x', 'a': 1}, properties=properties)
+        assert value == {'a': 1, 'b': 0, 'c': 3, 'x_2': 'x'}
+
+        # The key sets are computed once per properties dict.
+        assert validator._object_keys(properties) is validator._object_keys(properties)
+
+        # A changed properties dict is not served from the cache.
+        properties = {'a': {'type': 'integer'}}
+        assert {'a': 1} == await validator.validate_object({'a': 1}, properties=properties)
+        properties['b'] = {'type': 'integer'}
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_object({'a': 1}, properties=properties)
+        assert exc_info.value.issues == {'b': validator.ERROR_REQUIRED_FIELD}
+        properties['b'] = {'type': 'integer', 'required': False}
+        assert {'a': 1} == await validator.validate_object({'a': 1}, properties=properties)
+
     async def test_validate_object_default_string(self, validator):
         properties = {'test': {'type': 'string', 'required': False}}
         assert {} == await validator.validate_object({}, properties=properties, default=None, nullable=False,
@@ -1016,3 +1074,542 @@ class TestValidator:
             await validator.validate_array(['test1', 'test2'], items=None, default=None, nullable=False, minlength=None,
                                            maxlength=None, allowed=['test', 'test1'], strict_mode=True)
         assert str(exc_info.value) == validator.ERROR_UNALLOWED_VALUES.format(['test2'])
+
+    @pytest.mark.parametrize('use_numpy', [True, False])
+    async def test_validate_array_items_in_bulk(self, validator, monkeypatch, use_numpy):
+        if not use_numpy:
+            monkeypatch.setattr('aiovalidator.aiovalidator.numpy', None)
+
+        items = {'type': 'integer', 'min': 0, 'max': 10, 'allowed': list(range(0, 10))}
+        assert [1, 2, 9] == await validator.validate_array([1, 2, 9], items=items, strict_mode=True)
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array([1, -1, 10, 5, 12], items=items, strict_mode=True)
+        assert exc_info.value.issues == {
+            1: validator.ERROR_MIN_VALUE.format(0),
+            2: validator.ERROR_UNALLOWED_VALUE.format(10),
+            4: validator.ERROR_MAX_VALUE.format(10),
+        }
+
+        items = {'type': 'float', 'min': 0.0}
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array([float('nan'), -1.5], items=items, strict_mode=True)
+        assert exc_info.value.issues == {1: validator.ERROR_MIN_VALUE.format(0.0)}
+
+        # Mixed types are validated one by one, so integers are converted to floats.
+        assert [1.5, 2.0] == await validator.validate_array([1.5, 2], items=items, strict_mode=True)
+
+        # Mixed integers and floats are compared without a conversion to float64.
+        items = {'type': 'number', 'max': 2 ** 62}
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array([2 ** 62 + 1, 0.5], items=items, strict_mode=True)
+        assert exc_info.value.issues == {0: validator.ERROR_MAX_VALUE.format(2 ** 62)}
+
+        items = {'type': 'integer', 'max': 2.0 ** 62}
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array([2 ** 62 + 1], items=items, strict_mode=True)
+        assert exc_info.value.issues == {0: validator.ERROR_MAX_VALUE.format(2.0 ** 62)}
+
+    async def test_validate_array_items_in_bulk_overridden(self):
+        class CustomValidator(Validator):
+            def validate_integer(self, value, **kwargs):
+                return super().validate_integer(value, **kwargs) * 2
+
+        assert [2, 4] == await CustomValidator().validate_array([1, 2], items={'type': 'integer'})
+
+    @pytest.mark.parametrize('use_numpy', [True, False])
+    async def test_validate_array_buffer(self, validator, monkeypatch, use_numpy):
+        buffers = [array('B', [0, 1, 255]), memoryview(array('q', [0, 1, 255]))]
+        if use_numpy:
+            buffers.append(pytest.importorskip('numpy').array([0, 1, 255]))
+        else:
+            monkeypatch.setattr('aiovalidator.aiovalidator.numpy', None)
+
+        items = {'type': 'integer', 'min': 0, 'max': 255}
+        for buffer in buffers:
+            assert buffer is await validator.validate_array(buffer, items=items, strict_mode=True)
+
+        buffer = array('h', [0, -1, 256])
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array(buffer, items=items, strict_mode=True)
+        assert exc_info.value.issues == {1: validator.ERROR_MIN_VALUE.format(0), 2: validator.ERROR_MAX_VALUE.format(255)}
+
+        # Buffers of another kind are validated item by item.
+        assert [0.0, 1.0] == await validator.validate_array(array('i', [0, 1]), items={'type': 'float'},
+                                                            strict_mode=True)
+
+    async def test_validate_array_buffer_float32(self, validator):
+        numpy = pytest.importorskip('numpy')
+
+        # The items are compared as they are boxed, i.e. in float64.
+        for buffer in (numpy.array([0.1], dtype=numpy.float32), array('f', [0.1])):
+            with pytest.raises(ValidationError) as exc_info:
+                await validator.validate_array(buffer, items={'type': 'float', 'max': 0.1}, strict_mode=True)
+            assert exc_info.value.issues == {0: validator.ERROR_MAX_VALUE.format(0.1)}
+
+    async def test_validate_array_buffer_type(self, validator):
+        numpy = pytest.importorskip('numpy')
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array(numpy.zeros((2, 2)), items={'type': 'float'}, strict_mode=True)
+        assert str(exc_info.value) == validator.ERROR_BAD_TYPE.format('array')
+
+    async def test_validate_array_unique_indexes(self, validator):
+        assert [1, 2, 3] == await validator.validate_array([1, 2, 3], items={'type': 'integer'}, unique_indexes=[[]])
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array([1, 2, 1, 1], items={'type': 'integer'}, unique_indexes=[[]])
+        assert exc_info.value.issues == {2: validator.ERROR_NOT_UNIQUE.format(0), 3: validator.ERROR_NOT_UNIQUE.format(0)}
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array([[1, 2], [2, 1], [1, 2]], items=None, unique_indexes=[[]])
+        assert exc_info.value.issues == {2: validator.ERROR_NOT_UNIQUE.format(0)}
+
+        # Booleans are distinct from the numbers, the numbers are compared by value.
+        assert [1, True, 0, False] == await validator.validate_array([1, True, 0, False], unique_indexes=[[]])
+        assert [[1], [True]] == await validator.validate_array([[1], [True]], unique_indexes=[[]])
+        assert [{'a': 1}, {'a': True}] == await validator.validate_array([{'a': 1}, {'a': True}],
+                                                                         unique_indexes=['a'])
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array([1, 1.0], unique_indexes=[[]])
+        assert exc_info.value.issues == {1: validator.ERROR_NOT_UNIQUE.format(0)}
+
+    async def test_validate_array_unique_indexes_composite(self, validator):
+        items = {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer'},
+                'warehouse_id': {'type': 'integer'},
+                'sku': {'type': 'string', 'required': False},
+            }
+        }
+        rows = [
+            {'id': 1, 'warehouse_id': 1, 'sku': 'a'},
+            {'id': 2, 'warehouse_id': 2, 'sku': 'a'},
+            {'id': 3, 'warehouse_id': 1},
+            {'id': 4, 'warehouse_id': 1},
+            {'id': 1, 'warehouse_id': 1, 'sku': 'b'},
+            {'id': 6, 'warehouse_id': 1, 'sku': 'a'},
+            {'id': 7, 'warehouse_id': 'x', 'sku': 'a'},
+        ]
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array(rows, items=items, unique_indexes=['id', ['warehouse_id', 'sku']])
+        assert exc_info.value.issues == {
+            4: validator.ERROR_NOT_UNIQUE.format(0),
+            5: validator.ERROR_NOT_UNIQUE.format(0),
+            6: {'warehouse_id': validator.ERROR_BAD_TYPE.format('integer')},
+        }
+
+    async def test_validate_file(self, validator):
+        async def chunks():
+            yield b'\x89PNG\r\n'
+            yield b'\x1a\n' + b'\x00' * 100
+
+        file = await validator.validate_file(chunks(), maxsize=200, content_types=['image/*'], checksum='md5')
+        assert file.size == 108
+        assert file.content_type == 'image/png'
+        assert file.checksum == hashlib.md5(b'\x89PNG\r\n\x1a\n' + b'\x00' * 100).hexdigest()
+        assert file.read(4) == b'\x89PNG'
+
+        file = await validator.validate_file(b'hello', content_types=['text/plain'])
+        assert (file.size, file.content_type, file.read()) == (5, 'text/plain', b'hello')
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_file('hello')
+        assert str(exc_info.value) == validator.ERROR_BAD_TYPE.format('file')
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_file(b'%PDF-1.4', content_types=['image/png', 'text/*'])
+        assert str(exc_info.value) == validator.ERROR_FILE_CONTENT_TYPE.format('application/pdf')
+
+    async def test_validate_file_objects(self, validator, monkeypatch):
+        monkeypatch.setattr('aiovalidator.files.CHUNK_SIZE', 4)
+
+        file = await validator.validate_file(io.BytesIO(b'hello world'), maxsize=20, content_types=['text/*'])
+        assert (file.size, file.content_type, file.read()) == (11, 'text/plain', b'hello world')
+
+        # `aiohttp.web.FileField`, which is returned by `request.post()`.
+        web = pytest.importorskip('aiohttp.web')
+        field = web.FileField(name='f', filename='a.txt', file=io.BytesIO(b'hello'), content_type='text/plain',
+                              headers=None)
+        file = await validator.validate_file(field)
+        assert (file.filename, file.size, file.read()) == ('a.txt', 5, b'hello')
+
+        class AsyncFile:
+            def __init__(self, data):
+                self.data = io.BytesIO(data)
+
+            async def read(self, size=-1):
+                return self.data.read(size)
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_file(AsyncFile(b'x' * 100), maxsize=10)
+        assert str(exc_info.value) == validator.ERROR_FILE_MAX_SIZE.format(10)
+
+    async def test_validate_file_maxsize(self, validator):
+        read = []
+
+        class Part:
+            async def read_chunk(self):
+                read.append(None)
+                return b'x' * 10
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_file(Part(), maxsize=25)
+        assert str(exc_info.value) == validator.ERROR_FILE_MAX_SIZE.format(25)
+        assert len(read) == 3
+
+    async def test_validation_error_records(self, validator):
+        items = {'type': 'object', 'properties': {'test': {'type': 'string'}, 'tags': {'type': 'array'}}}
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array([{'test': False, 'tags': []}, {'tags': 1}], items=items, strict_mode=True)
+        assert sorted(exc_info.value.records) == [
+            ((0, 'test'), validator.ERROR_BAD_TYPE.format('string')),
+            ((1, 'tags'), validator.ERROR_BAD_TYPE.format('array')),
+            ((1, 'test'), validator.ERROR_REQUIRED_FIELD),
+        ]
+        assert exc_info.value.issues == {
+            0: {'test': validator.ERROR_BAD_TYPE.format('string')},
+            1: {'tags': validator.ERROR_BAD_TYPE.format('array'), 'test': validator.ERROR_REQUIRED_FIELD},
+        }
+
+    async def test_validation_error_nested_dict_issues(self):
+        class CustomValidator(Validator):
+            def validate_point(self, value, **kwargs):
+                raise ValidationError('bad point', issues={'x': 'too far', 'y': {'z': 'too deep'}})
+
+        with pytest.raises(ValidationError) as exc_info:
+            await CustomValidator().validate_array([1], items={'type': 'point'})
+        assert exc_info.value.issues == {0: {'x': 'too far', 'y': {'z': 'too deep'}}}
+        assert isinstance(exc_info.value.records, Issues)
+        assert len(exc_info.value.records) == 2
+
+    async def test_validate_array_max_issues(self, validator):
+        items = {'type': 'object', 'properties': {'a': {'type': 'integer'}, 'b': {'type': 'integer'}}}
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array([{'a': 'x', 'b': 'x'}] * 10, items=items, max_issues=3)
+        assert len(exc_info.value.records) == 3
+        assert exc_info.value.truncated is True
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array([1, 'x', 'x'], items={'type': 'integer'}, max_issues=2)
+        assert exc_info.value.issues == {1: validator.ERROR_BAD_TYPE.format('integer'),
+                                         2: validator.ERROR_BAD_TYPE.format('integer')}
+        assert exc_info.value.truncated is False
+
+    async def test_validate_object_max_issues(self):
+        validator = Validator(max_issues=2)
+        properties = {'a': {'type': 'integer'}, 'b': {'type': 'integer'}, 'c': {'type': 'integer'}}
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_object({'a': 'x', 'b': 'x', 'c': 'x'}, properties=properties)
+        assert exc_info.value.issues == {'a': validator.ERROR_BAD_TYPE.format('integer'),
+                                         'b': validator.ERROR_BAD_TYPE.format('integer')}
+        assert exc_info.value.truncated is True
+
+        # The issues of a nested truncated container mark the whole error as truncated.
+        properties = {'items': {'type': 'array', 'items': {'type': 'integer'}}}
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_object({'items': ['x'] * 1000}, properties=properties)
+        assert len(exc_info.value.records) == 2
+        assert exc_info.value.truncated is True
+
+    async def test_validate_size_guards(self):
+        validator = Validator(max_depth=3, max_string_length=5)
+        schema = {'type': 'array', 'items': {'type': 'array'}}
+
+        assert [[1], [2]] == await validator.validate([[1], [2]], **schema)
+
+        deep = []
+        for _ in range(0, 10000):
+            deep = [deep]
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate(deep, **schema)
+        assert str(exc_info.value) == validator.ERROR_MAX_DEPTH.format(3)
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate([['x' * 6]], **schema)
+        assert str(exc_info.value) == validator.ERROR_STR_MAX_LENGTH.format(5)
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate([[1], [2]], max_nodes=4, **schema)
+        assert str(exc_info.value) == validator.ERROR_MAX_NODES.format(4)
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate({'a': 1, 'b': 2}, type='object', max_keys=1)
+        assert str(exc_info.value) == validator.ERROR_MAX_KEYS.format(1)
+
+    async def test_validate_object_record(self, validator):
+        properties = {
+            'id': {'type': 'integer'},
+            'title': {'type': 'string', 'required': False, 'default': 'untitled'},
+            'tags': {'type': 'array', 'items': {'type': 'string'}, 'required': False},
+        }
+        items = {'type': 'object', 'properties': properties, 'record': True}
+
+        records = await validator.validate_array([{'id': 1}, {'id': 2, 'tags': ['a']}], items=items)
+        assert [record.to_dict() for record in records] == [
+            {'id': 1, 'title': 'untitled', 'tags': None},
+            {'id': 2, 'title': 'untitled', 'tags': ['a']},
+        ]
+        assert type(records[0]) is type(records[1])
+
+        with pytest.raises(ValueError):
+            await validator.validate_object({'id': 1}, properties=properties, allow_unknown=True, record=True)
+
+        # Unique indexes apply to the records as well.
+        for rows, unique_indexes in [
+            ([{'id': 1, 'title': 'a'}, {'id': 2}, {'id': 1, 'title': 'b'}], ['id']),
+            ([{'id': 1, 'title': 'a'}, {'id': 2}, {'id': 1, 'title': 'a', 'tags': ['x']}], [['id', 'title']]),
+            ([{'id': 1, 'tags': ['x']}, {'id': 2}, {'id': 1, 'tags': ['x']}], [[]]),
+        ]:
+            with pytest.raises(ValidationError) as exc_info:
+                await validator.validate_array(rows, items=items, unique_indexes=unique_indexes)
+            assert exc_info.value.issues == {2: validator.ERROR_NOT_UNIQUE.format(0)}
+
+    async def test_validate_exotic_types(self, validator):
+        class Flag(IntEnum):
+            ON = 1
+
+        class Text(str):
+            pass
+
+        assert Flag.ON is validator.validate_integer(Flag.ON, strict_mode=True)
+        assert Text('x') == validator.validate_string(Text('x'), strict_mode=True)
+        assert UserList([1]) == await validator.validate_array(UserList([1]), items={'type': 'integer'})
+        assert OrderedDict(a=1) == await validator.validate_object(OrderedDict(a=1), properties={'a': {'type': 'integer'}})
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_array({1, 2}, items={'type': 'integer'})
+        assert str(exc_info.value) == validator.ERROR_BAD_TYPE.format('array')
+
+    async def test_register_type(self):
+        class CustomValidator(Validator):
+            pass
+
+        def validate_even(validator, value, *, strict_mode=True):
+            value = validator.validate_integer(value, strict_mode=strict_mode)
+            if value % 2:
+                raise ValidationError('must be even')
+            return value
+
+        async def validate_known(validator, value, *, known=(), strict_mode=True):
+            if value not in known:
+                raise ValidationError('unknown value')
+            return value
+
+        CustomValidator.register_type('even', validate_even)
+        CustomValidator.register_type('known', validate_known)
+        assert CustomValidator.get_type('even') == (validate_even, False, None)
+        assert CustomValidator.get_type('known') == (validate_known, True, None)
+        assert Validator.get_type('even') is None
+
+        validator = CustomValidator()
+        items = {'type': 'object', 'properties': {'n': {'type': 'even'}, 'k': {'type': 'known', 'known': ['a']}}}
+        assert [{'n': 2, 'k': 'a'}] == await validator.validate([{'n': 2, 'k': 'a'}], type='array', items=items)
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate([{'n': 3, 'k': 'b'}], type='array', items=items)
+        assert exc_info.value.issues == {0: {'n': 'must be even', 'k': 'unknown value'}}
+
+        with pytest.raises(AttributeError):
+            await Validator().validate(2, type='even')
+
+    def test_register_type_methods(self):
+        class CustomValidator(Validator):
+            async def validate_remote(self, value, strict_mode=True):
+                return value
+
+        assert CustomValidator.get_type('remote') == (CustomValidator.validate_remote, True, None)
+        assert CustomValidator.get_type('integer') == (Validator.validate_integer, False, None)
+
+    async def test_subclass_fast_paths(self):
+        class PlainValidator(Validator):
+            pass
+
+        # The inherited types are the ones of `Validator`, so the bulk checks, the optimizer and the guided JSON
+        # decoder are kept.
+        for name in ('integer', 'number', 'string', 'object', 'array'):
+            assert PlainValidator.get_type(name) is Validator.get_type(name)
+        assert PlainValidator()._validate_items_in_bulk(list(range(100)), {'type': 'integer', 'min': 0})
+        assert PlainValidator().compile({'type': 'string', 'allowed': ['a']}).schema['allowed'] == frozenset('a')
+
+    async def test_register_type_mro(self):
+        class Mixin:
+            def validate_even(self, value, strict_mode=True):
+                if value % 2:
+                    raise ValidationError('must be even')
+                return value
+
+        class MixinValidator(Mixin, Validator):
+            pass
+
+        assert 2 == await MixinValidator().validate(2, type='even')
+
+        class BaseValidator(Validator):
+            pass
+
+        class CustomValidator(BaseValidator):
+            def validate_odd(self, value, strict_mode=True):
+                return value
+
+        # Subclasses created before the type is registered see it, unless they override it.
+        BaseValidator.register_type('odd', Validator.validate_integer)
+        BaseValidator.register_type('positive', Validator.validate_integer)
+        assert CustomValidator.get_type('positive') == (Validator.validate_integer, False, None)
+        assert CustomValidator.get_type('odd') == (CustomValidator.validate_odd, False, None)
+        assert 'x' == await CustomValidator().validate('x', type='odd')
+        assert Validator.get_type('positive') is None
+
+    async def test_register_type_batch(self):
+        class CustomValidator(Validator):
+            pass
+
+        calls = []
+
+        async def load_customers(validator, values, *, strict_mode=True):
+            calls.append(values)
+            return [value if value % 2 else ValidationError('unknown customer') for value in values]
+
+        CustomValidator.register_type('customer', Validator.validate_integer, batch=load_customers)
+        validator = CustomValidator()
+
+        items = {'type': 'object', 'properties': {'id': {'type': 'integer'}, 'customer_id': {'type': 'customer'}}}
+        value = [{'id': i, 'customer_id': i % 10} for i in range(1000)]
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate(value, type='array', items=items)
+        assert len(calls) == 1
+        assert sorted(calls[0]) == list(range(10))
+        assert len(exc_info.value.issues) == 500
+        assert exc_info.value.issues[0] == {'customer_id': 'unknown customer'}
+        assert 1 not in exc_info.value.issues
+
+        # Values, which are validated concurrently, share the batch.
+        assert [1, 3] == await asyncio.gather(validator.validate(1, type='customer'),
+                                              validator.validate(3, type='customer'))
+        assert calls[-1] == [1, 3]
+
+        # Errors of the batch function are raised for all the values.
+        async def load_failing(validator, values, *, strict_mode=True):
+            raise ConnectionError('database is unavailable')
+
+        CustomValidator.register_type('failing', batch=load_failing)
+        with pytest.raises(ConnectionError):
+            await validator.validate([1, 2], type='array', items={'type': 'failing'})
+
+        with pytest.raises(TypeError):
+            CustomValidator.register_type('empty')
+
+    async def test_timeout(self):
+        class CustomValidator(Validator):
+            async def validate_slow(self, value, strict_mode=True):
+                await asyncio.sleep(value)
+                return value
+
+        validator = CustomValidator()
+        items = {'type': 'object', 'properties': {'delay': {'type': 'slow'}}}
+        assert [{'delay': 0}] == await validator.validate([{'delay': 0}], type='array', items=items, timeout=1)
+
+        # Pending asynchronous checks are cancelled.
+        with pytest.raises(ValidationTimeout) as exc_info:
+            await validator.validate([{'delay': 0}, {'delay': 10}], type='array', items=items, timeout=0.01)
+        assert exc_info.value.path == (1, 'delay')
+        assert str(exc_info.value) == "validation has timed out after 0.01s at '/1/delay'"
+
+        # The deadline is checked before each nested value.
+        with pytest.raises(ValidationTimeout) as exc_info:
+            await validator.validate([[1, 2]], type='array', items={'type': 'array', 'items': {'type': 'integer'}},
+                                     timeout=0)
+        assert exc_info.value.path == ()
+
+        # The deadline is not kept by the validator.
+        assert validator._deadline is None
+        assert [1] == await validator.validate([1], type='array', items={'type': 'integer'})
+
+    def test_validate_bytes(self, validator):
+        for value in (b'abc', bytearray(b'abc'), memoryview(b'abc')):
+            assert validator.validate_bytes(value, minlength=3, maxlength=3, regex=b'^[a-c]+$') is value
+        assert validator.validate_bytes(memoryview(array('H', [1, 2])), maxlength=4).nbytes == 4
+        assert validator.validate_bytes(memoryview(b'\xd0\xb9'), decode=True) == 'й'
+        assert validator.validate_bytes('й', strict_mode=False) == b'\xd0\xb9'
+        assert validator.validate_bytes(None, nullable=True) is None
+
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate_bytes('abc')
+        assert str(exc_info.value) == validator.ERROR_BAD_TYPE.format('bytes')
+
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate_bytes(b'abcd', maxlength=3)
+        assert str(exc_info.value) == validator.ERROR_BYTES_MAX_LENGTH.format(3)
+
+        # Empty bytes are not allowed by default, as empty strings.
+        assert validator.validate_bytes(b'', empty=True) == b''
+        for value in (b'', bytearray(), memoryview(b'')):
+            with pytest.raises(ValidationError) as exc_info:
+                validator.validate_bytes(value)
+            assert str(exc_info.value) == validator.ERROR_EMPTY_NOT_ALLOWED
+
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate_bytes(bytearray(b'abd'), regex='^[a-c]+$')
+        assert str(exc_info.value) == validator.ERROR_STR_REGEX.format('^[a-c]+$')
+
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate_bytes(b'\xff', encoding='utf-8')
+        assert str(exc_info.value) == validator.ERROR_BYTES_ENCODING.format('utf-8')
+
+        with pytest.raises(ValidationError):
+            validator.validate_bytes(memoryview(b'abcd')[::2])
+
+    async def test_validate_array_async_iterable(self, validator):
+        produced = []
+
+        async def rows(count):
+            for i in range(count):
+                produced.append(i)
+                yield {'id': i, 'name': str(i)}
+
+        items = {'type': 'object', 'properties': {'id': {'type': 'integer'}, 'name': {'type': 'string'}}}
+        stream = await validator.validate(rows(1000), type='array', items=items, unique_indexes=['id'])
+
+        # The items are pulled one by one, as they are consumed.
+        assert produced == []
+        async for row in stream:
+            assert produced[-1] == row['id']
+            if row['id'] == 9:
+                break
+        assert len(produced) == 10
+
+        async def invalid():
+            yield 1
+            yield 'x'
+            yield 3
+
+        with pytest.raises(ValidationError) as exc_info:
+            [item async for item in await validator.validate_array(invalid(), items={'type': 'integer'})]
+        assert exc_info.value.issues == {1: validator.ERROR_BAD_TYPE.format('integer')}
+
+        with pytest.raises(ValidationError) as exc_info:
+            array = await validator.validate_array(rows(2), items=items, unique_indexes=['name'], minlength=3)
+            [item async for item in array]
+        assert str(exc_info.value) == validator.ERROR_MIN_LENGTH.format(3)
+
+        produced.clear()
+        with pytest.raises(ValidationError) as exc_info:
+            [item async for item in await validator.validate_array(rows(100), maxlength=2)]
+        assert str(exc_info.value) == validator.ERROR_MAX_LENGTH.format(2)
+        assert len(produced) == 3
+
+    async def test_validate_array_async_iterable_close(self, validator):
+        closed = []
+
+        async def source():
+            try:
+                for item in (1, 'x', 3):
+                    yield item
+            finally:
+                closed.append(True)
+
+        # The source is closed as soon as an item is invalid, not when it is garbage collected.
+        stream = await validator.validate_array(source(), items={'type': 'integer'})
+        with pytest.raises(ValidationError):
+            async for _ in stream:
+                pass
+        assert closed == [True]
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import json
+import sys
+from functools import partial
+
+import pytest
+from aiovalidator import Validator, ValidationError, Schema
+
+__all__ = ['TestValidateJson']
+
+SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'id': {'type': 'integer', 'min': 1},
+        'tags': {'type': 'array', 'items': {'type': 'string'}, 'maxlength': 3},
+        'items': {
+            'type': 'array',
+            'maxlength': 4,
+            'unique_indexes': ['sku'],
+            'items': {
+                'type': 'object',
+                'properties': {
+                    'sku': {'type': 'string'},
+                    'qty': {'type': 'integer', 'required': False, 'default': 1},
+                    '^x-[a-z]+$': {'type': 'string'},
+                },
+            },
+        },
+    },
+}
+
+
+@pytest.fixture(params=[None, 100], ids=['loads', 'guided'])
+def validator(request):
+    # Without the limits, the document is parsed by `json.loads`, with them by the guided decoder.
+    return Validator(max_issues=request.param)
+
+
+class TestValidateJson:
+    async def test_valid(self, validator):
+        document = {'id': 1, 'tags': ['a', 'b'], 'items': [{'sku': 'a', 'x-note': 'n'}, {'sku': 'b', 'qty': 2}]}
+        raw = json.dumps(document).encode()
+        expected = {'id': 1, 'tags': ['a', 'b'],
+                    'items': [{'sku': 'a', 'qty': 1, 'x-note': 'n'}, {'sku': 'b', 'qty': 2}]}
+        assert expected == await validator.validate_json(raw, schema=SCHEMA)
+        assert expected == await validator.validate_json(memoryview(raw), schema=SCHEMA)
+        assert expected == await Schema(SCHEMA, validator).validate_json(' \n' + raw.decode() + ' ')
+        assert expected == await validator.validate(raw.decode(), type='json', schema=SCHEMA)
+        assert [] == await validator.validate_json('[]', schema={'type': 'array', 'items': SCHEMA})
+        schema = {'type': 'object', 'properties': {}, 'nullable': True}
+        assert None is await validator.validate_json('null', schema=schema)
+
+    async def test_invalid(self, validator):
+        raw = json.dumps({'id': 0, 'tags': ['a', 1], 'extra': {'a': [1]},
+                          'items': [{'sku': 'a', 'qty': 'x'}, {'qty': 1}, {'sku': 'b'}, {'sku': 'b'}]})
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_json(raw, schema=SCHEMA)
+        assert str(exc_info.value) == validator.ERROR_OBJECT_PROPERTIES
+        assert exc_info.value.issues == {
+            'id': validator.ERROR_MIN_VALUE.format(1),
+            'tags': {1: validator.ERROR_BAD_TYPE.format('string')},
+            'extra': validator.ERROR_UNKNOWN_FIELD,
+            'items': {0: {'qty': validator.ERROR_BAD_TYPE.format('integer')},
+                      1: {'sku': validator.ERROR_REQUIRED_FIELD},
+                      3: validator.ERROR_NOT_UNIQUE.format(2)},
+        }
+
+        # The issues are the same as of the parsed document.
+        with pytest.raises(ValidationError) as expected_info:
+            await validator.validate(json.loads(raw), **SCHEMA)
+        assert exc_info.value.issues == expected_info.value.issues
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_json('[1]', schema=SCHEMA)
+        assert str(exc_info.value) == validator.ERROR_BAD_TYPE.format('object')
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_json(b'\xff', schema=SCHEMA)
+        assert str(exc_info.value) == validator.ERROR_BAD_JSON
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_json(42, schema=SCHEMA)
+        assert str(exc_info.value) == validator.ERROR_BAD_TYPE.format('json')
+
+    @pytest.mark.parametrize('raw', ['', '{', '{"id": 1', '{"id" 1}', '{"id": 1,}', '{id: 1}', '{"id": 1} x',
+                                     '{"items": [{"sku": "a"} {"sku": "b"}]}', '{"items": [{"sku": "a"},]}'])
+    async def test_bad_json(self, validator, raw):
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_json(raw, schema=SCHEMA)
+        assert str(exc_info.value) == validator.ERROR_BAD_JSON
+
+    async def test_early_rejection(self, validator):
+        # The parsing stops at the first issue, so the rest of the document, even malformed, is not parsed.
+        raw = '{"id": 0, "tags": [1, 2' + ', 3' * 1000
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_json(raw, schema=SCHEMA, max_issues=1)
+        assert exc_info.value.issues == {'id': validator.ERROR_MIN_VALUE.format(1)}
+        assert exc_info.value.truncated
+
+        # Too long arrays are rejected before the rest of the items is parsed.
+        raw = '[' + ', '.join('{{"sku": "{0}"}}'.format(i) for i in range(5)) + ', {"sku": '
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_json(raw, schema=SCHEMA['properties']['items'], max_issues=10)
+        assert str(exc_info.value) == validator.ERROR_MAX_LENGTH.format(4)
+
+    async def test_issue_order(self, validator):
+        # Unknown keys are reported after the properties and the issues of the items of a too long array are
+        # dropped, as by `validate`.
+        schema = {'type': 'array', 'maxlength': 1, 'items': SCHEMA['properties']['items']['items']}
+        cases = [
+            ('{"extra": 1, "id": 0}', SCHEMA),
+            ('[{"sku": "a", "qty": "x"}, {"sku": "b"}]', schema),
+            ('[{"sku": "a", "qty": "x"}]', schema),
+            ('{"id": 1, "tags": [], "items": [{"sku": "a", "qty": "x"}, {"sku": "b"}, {"sku": "c"}, {"sku": "d"}, '
+             '{"sku": "e"}]}', SCHEMA),
+        ]
+        for raw, document_schema in cases:
+            with pytest.raises(ValidationError) as exc_info:
+                await validator.validate_json(raw, schema=document_schema, max_issues=1)
+            with pytest.raises(ValidationError) as expected_info:
+                await validator.validate(json.loads(raw), **document_schema, max_issues=1)
+            assert exc_info.value.issues == expected_info.value.issues
+            assert str(exc_info.value) == str(expected_info.value)
+
+    @pytest.mark.parametrize('limits, raw, error', [
+        ({'max_string_length': 5}, '{"id": 1, "tags": ["abcdef"]}', Validator.ERROR_STR_MAX_LENGTH.format(5)),
+        ({'max_depth': 2}, '{"items": [{"sku": "a"}]}', Validator.ERROR_MAX_DEPTH.format(2)),
+        ({'max_depth': 2}, '{"id": 1, "extra": [[1]]}', Validator.ERROR_MAX_DEPTH.format(2)),
+        ({'max_nodes': 4}, '{"id": 1, "tags": ["a", "b", "c"]}', Validator.ERROR_MAX_NODES.format(4)),
+        ({'max_keys': 1}, '{"id": 1, "tags": []}', Validator.ERROR_MAX_KEYS.format(1)),
+        # An unknown key is counted once, so only the unknown key is reported.
+        ({'max_keys': 4}, '{"id": 1, "tags": [], "items": [], "x": 2}', Validator.ERROR_OBJECT_PROPERTIES),
+    ])
+    async def test_size_limits(self, limits, raw, error):
+        validator = Validator(**limits)
+        validators = (
+            partial(validator.validate_json, schema=SCHEMA),
+            Schema(SCHEMA, validator).validate_json,
+            partial(validator.validate, type='json', schema=SCHEMA),
+        )
+        for validate in validators:
+            with pytest.raises(ValidationError) as exc_info:
+                await validate(raw)
+            assert str(exc_info.value) == error
+
+        # The same as of the parsed document.
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate(json.loads(raw), **SCHEMA)
+        assert str(exc_info.value) == error
+
+    async def test_size_limits_unknown_keys(self):
+        # Unknown keys are counted once, the stripped ones as well.
+        validator = Validator(max_keys=3)
+        schema = {'type': 'object', 'properties': {'id': {'type': 'integer'}}}
+        raw = '{"id": 1, "x": 2, "y": 3}'
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_json(raw, schema=schema)
+        assert exc_info.value.issues == {'x': validator.ERROR_UNKNOWN_FIELD, 'y': validator.ERROR_UNKNOWN_FIELD}
+
+        with pytest.raises(ValidationError) as expected_info:
+            await validator.validate(json.loads(raw), **schema)
+        assert exc_info.value.issues == expected_info.value.issues
+
+        schema = dict(schema, allow_unknown='strip')
+        assert {'id': 1} == await validator.validate_json(raw, schema=schema)
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_json('{"id": 1, "x": 2, "y": 3, "z": 4}', schema=schema)
+        assert str(exc_info.value) == validator.ERROR_MAX_KEYS.format(3)
+
+        # The limits apply to the document, not to its text.
+        schema = {'type': 'object', 'properties': {'id': {'type': 'integer'}}}
+        assert {'id': 1} == await Validator(max_string_length=5).validate('{"id": 1}', type='json', schema=schema)
+
+    async def test_too_deep(self, validator):
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_json('[' * 100000, schema={'type': 'array'})
+        assert str(exc_info.value) == validator.ERROR_MAX_DEPTH.format(sys.getrecursionlimit())
+
+        with pytest.raises(ValidationError) as exc_info:
+            await Validator(max_depth=10).validate_json('[' * 100000, schema={'type': 'array'})
+        assert str(exc_info.value) == validator.ERROR_MAX_DEPTH.format(10)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import json
+
+import pytest
+from aiovalidator import Validator, ValidationError
+from aiovalidator.formats import is_uuid, is_email, is_ipv4, is_ipv6, is_date, is_hostname
+
+__all__ = ['TestFormats']
+
+
+class TestFormats:
+    def test_uuid(self):
+        assert is_uuid('123e4567-e89b-12d3-a456-426614174000')
+        assert is_uuid('123E4567-E89B-12D3-A456-426614174000')
+        assert not is_uuid('123e4567e89b12d3a456426614174000')
+        assert not is_uuid('123e4567-e89b-12d3-a456-42661417400g')
+        assert not is_uuid('123e4567-e89b-12d3-a456-4266141740-0')
+        assert not is_uuid('{23e4567-e89b-12d3-a456-42661417400}')
+
+    def test_ipv4(self):
+        assert is_ipv4('192.168.0.1')
+        assert is_ipv4('0.0.0.0')
+        assert not is_ipv4('256.1.1.1')
+        assert not is_ipv4('1.2.3')
+        assert not is_ipv4('01.2.3.4')
+        assert not is_ipv4('1.2.3.4 ')
+        assert not is_ipv4('1.2.3.\x00')
+        assert not is_ipv4('::1')
+
+    def test_ipv6(self):
+        assert is_ipv6('::1')
+        assert is_ipv6('2001:db8::1')
+        assert is_ipv6('::ffff:192.168.0.1')
+        assert not is_ipv6('1::2::3')
+        assert not is_ipv6('2001:db8::g')
+        assert not is_ipv6('192.168.0.1')
+        assert not is_ipv6('::１')
+
+    def test_date(self):
+        assert is_date('2018-02-28')
+        assert is_date('2016-02-29')
+        assert not is_date('2018-02-29')
+        assert not is_date('2018-13-01')
+        assert not is_date('0000-01-01')
+        assert not is_date('2018/02/28')
+        assert not is_date('2018-2-028')
+        assert not is_date('２018-02-28')
+        assert not is_date('1900-02-29')
+        assert not is_date('2018-02--8')
+
+    def test_hostname(self):
+        assert is_hostname('example.com')
+        assert is_hostname('localhost')
+        assert is_hostname('a-b.example.com.')
+        assert not is_hostname('')
+        assert not is_hostname('-a.example.com')
+        assert not is_hostname('a..example.com')
+        assert not is_hostname('a_b.example.com')
+        assert not is_hostname('a' * 64 + '.com')
+        assert not is_hostname('exämple.com')
+
+    def test_email(self):
+        assert is_email('user@example.com')
+        assert is_email("o'neil+tag@mail.example.com")
+        assert not is_email('user@localhost')
+        assert not is_email('@example.com')
+        assert not is_email('user@')
+        assert not is_email('us er@example.com')
+        assert not is_email('.user@example.com')
+        assert not is_email('us..er@example.com')
+        assert not is_email('user@@example.com')
+
+    def test_validate_string(self):
+        validator = Validator()
+        assert validator.validate_string('::1', format='ipv6') == '::1'
+
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate_string('user@', format='email')
+        assert str(exc_info.value) == validator.ERROR_STR_FORMAT.format('email')
+
+        with pytest.raises(ValueError):
+            validator.validate_string('x', format='unknown')
+
+    def test_surrogates(self):
+        # A lone surrogate, which `json.loads` produces from an escape, can not be encoded.
+        value = json.loads('"\\ud800"')
+        assert not is_uuid(value * 36)
+        assert not is_date('2018-02-2' + value)
+        assert not is_hostname('example.c' + value)
+        assert not is_email('user@example.c' + value)
+        assert not is_email(value + '@example.com')
+
+        validator = Validator()
+        for format in ('email', 'date', 'hostname', 'uuid'):
+            with pytest.raises(ValidationError):
+                validator.validate_string('2018-02-2' + value, format=format)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import asyncio
+import pytest
+from aiovalidator import Validator, ValidationError, LazyObject
+
+__all__ = ['TestLazyObject']
+
+
+@pytest.fixture
+def validator():
+    return Validator()
+
+
+class TestLazyObject:
+    PROPERTIES = {
+        'id': {'type': 'integer'},
+        'name': {'type': 'string', 'maxlength': 3},
+        'tags': {'type': 'array', 'items': {'type': 'string'}},
+        'score': {'type': 'float', 'required': False, 'default': 0.0},
+    }
+
+    async def test_structure(self, validator):
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.validate_object({'id': 'x', 'extra': 1}, properties=self.PROPERTIES, lazy=True)
+        assert exc_info.value.issues == {'name': validator.ERROR_REQUIRED_FIELD,
+                                         'tags': validator.ERROR_REQUIRED_FIELD,
+                                         'extra': validator.ERROR_UNKNOWN_FIELD}
+
+        with pytest.raises(ValidationError):
+            await validator.validate_object([], properties=self.PROPERTIES, lazy=True)
+
+        with pytest.raises(ValueError):
+            await validator.validate_object({}, properties=self.PROPERTIES, lazy=True, record=True)
+
+    async def test_read(self, validator):
+        document = await validator.validate_object({'id': 1, 'name': 'long', 'tags': ['a']},
+                                                   properties=self.PROPERTIES, lazy=True)
+        assert isinstance(document, LazyObject)
+        assert sorted(document) == ['id', 'name', 'score', 'tags']
+        assert document.pending == ['id', 'name', 'tags', 'score']
+
+        assert document['id'] == 1
+        assert document['tags'] == ['a']
+        assert document.pending == ['name', 'score']
+
+        with pytest.raises(ValidationError) as exc_info:
+            document['name']
+        assert exc_info.value.issues == {'name': validator.ERROR_STR_MAX_LENGTH.format(3)}
+
+        with pytest.raises(KeyError):
+            document['missing']
+
+        # Membership does not validate the property.
+        assert 'name' in document
+        assert 'missing' not in document
+        assert document.pending == ['name', 'score']
+
+    async def test_resolve(self, validator):
+        value = {'id': 1, 'name': 'abc', 'tags': ['a', 1]}
+        document = await validator.validate_object(value, properties=self.PROPERTIES, lazy=True)
+        with pytest.raises(ValidationError) as exc_info:
+            await document.resolve()
+        assert exc_info.value.issues == {'tags': {1: validator.ERROR_BAD_TYPE.format('string')}}
+
+        value = {'id': 1, 'name': 'abc', 'tags': ['a']}
+        document = await validator.validate_object(value, properties=self.PROPERTIES, lazy=True)
+        assert await document.resolve() == {'id': 1, 'name': 'abc', 'tags': ['a'], 'score': 0.0}
+        assert document.pending == []
+
+    async def test_async_property(self):
+        class CustomValidator(Validator):
+            async def validate_remote(self, value, strict_mode=True):
+                await asyncio.sleep(0)
+                return value * 2
+
+        validator = CustomValidator()
+        document = await validator.validate_object({'n': 2}, properties={'n': {'type': 'remote'}}, lazy=True)
+        with pytest.raises(RuntimeError):
+            document['n']
+        assert await document.resolve() == {'n': 4}
+        assert document['n'] == 4
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import pytest
+from aiovalidator import Validator, ValidationError
+from aiovalidator.optimizer import optimize
+
+__all__ = ['TestOptimize']
+
+SCHEMAS = [
+    {'type': 'string', 'minlength': 2, 'maxlength': 3, 'allowed': ['ab', 'abc', 'x'], 'regex': '^a', 'format': None},
+    {'type': 'string', 'allowed': ['123e4567-e89b-12d3-a456-426614174000'], 'format': 'uuid', 'regex': '^[0-9a-f-]+$'},
+    {'type': 'string', 'minlength': 1, 'allowed': ['a', 'b'], 'regex': '^a'},
+    {'type': 'string', 'minlength': 0, 'empty': True},
+    {'type': 'integer', 'min': 0, 'max': 10, 'allowed': [-1, 0, 5, 11]},
+    {'type': 'number', 'min': 0.5, 'allowed': [0, 1.5, 2]},
+    {'type': 'array', 'minlength': 0, 'allowed': [1, 2, 3]},
+]
+
+VALUES = [None, '', 'a', 'ab', 'abc', 'abcd', 'x', 'b', '123e4567-e89b-12d3-a456-426614174000', -1, 0, 1, 1.5, 2, 5, 11,
+          True, [], [1, 2], [1, 4], {}]
+
+
+@pytest.fixture
+def validator():
+    return Validator()
+
+
+class TestOptimize:
+    def test_optimize(self, validator):
+        assert optimize(SCHEMAS[0], validator) == {
+            'type': 'string', 'minlength': 2, 'maxlength': 3, 'empty': True, 'allowed': frozenset(['ab', 'abc', 'x']),
+            'regex': '^a', 'format': None,
+        }
+        assert optimize(SCHEMAS[1], validator) == {
+            'type': 'string', 'allowed': frozenset(['123e4567-e89b-12d3-a456-426614174000']),
+        }
+        assert optimize(SCHEMAS[3], validator) == {'type': 'string', 'empty': True}
+        assert optimize(SCHEMAS[4], validator) == {'type': 'integer', 'min': 0, 'max': 10, 'allowed': frozenset([0, 5])}
+        assert optimize(SCHEMAS[6], validator) == {'type': 'array', 'allowed': frozenset([1, 2, 3])}
+        assert optimize({'type': 'string', 'allowed': [['a']]}, validator)['allowed'] == [['a']]
+
+    def test_custom_types(self):
+        class CustomValidator(Validator):
+            def validate_string(self, value, **kwargs):
+                return value
+
+        schema = {'type': 'string', 'minlength': 0}
+        assert optimize(schema, CustomValidator()) == schema
+
+    @pytest.mark.parametrize('schema', SCHEMAS)
+    async def test_same_errors(self, validator, schema):
+        optimized = validator.compile(schema)
+        plain = validator.compile(schema, optimize=False)
+
+        for value in VALUES:
+            results = []
+            for compiled in (plain, optimized):
+                try:
+                    results.append(compiled.validate_sync(value, strict_mode=False))
+                except ValidationError as e:
+                    results.append((e.msg, e.issues))
+            assert results[0] == results[1], value
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import pytest
+
+from aiovalidator import Validator, ValidationError
+from aiovalidator.patch import PatchError, apply_patch, parse_pointer
+
+
+class TestPatch:
+
+    def test_parse_pointer(self):
+        assert () == parse_pointer('')
+        assert ('a', '0', 'b/c', 'd~e') == parse_pointer('/a/0/b~1c/d~0e')
+
+        with pytest.raises(PatchError):
+            parse_pointer('a')
+
+    def test_apply_patch(self):
+        document = {'a': {'b': 1}, 'c': [1, 2]}
+        paths = apply_patch(document, [
+            {'op': 'replace', 'path': '/a/b', 'value': 2},
+            {'op': 'add', 'path': '/c/-', 'value': 3},
+            {'op': 'move', 'from': '/a', 'path': '/d'},
+            {'op': 'remove', 'path': '/c/0'},
+            {'op': 'test', 'path': '/d/b', 'value': 2},
+        ])
+        assert document == {'c': [2, 3], 'd': {'b': 2}}
+        assert paths == [('a', 'b'), ('c',), ('a',), ('d',), ('c',)]
+
+        with pytest.raises(PatchError):
+            apply_patch(document, [{'op': 'remove', 'path': '/x/y'}])
+
+        with pytest.raises(PatchError):
+            apply_patch(document, [{'op': 'add', 'path': '/x'}])
+
+
+class TestRevalidate:
+
+    @pytest.fixture
+    def validator(self):
+        return Validator()
+
+    @pytest.fixture
+    def schema(self):
+        return {
+            'type': 'object',
+            'properties': {
+                'title': {'type': 'string'},
+                'note': {'type': 'string', 'required': False, 'default': ''},
+                'tags': {'type': 'array', 'maxlength': 2, 'items': {'type': 'string'}},
+                'sizes': {
+                    'type': 'object',
+                    'properties': {'^[a-z]+$': {'type': 'integer', 'min': 0}}
+                },
+            }
+        }
+
+    async def test_revalidate_paths(self, validator, schema):
+        document = {'title': 'hello', 'tags': ['a'], 'sizes': {'s': 1}}
+
+        document['sizes']['m'] = '2'
+        document['tags'].append('b')
+        assert document == await validator.revalidate(document, ['/sizes/m', ('tags', 1)], strict_mode=False,
+                                                      **schema)
+        assert document['sizes']['m'] == 2
+
+        document['tags'].append('c')
+        document['sizes']['l'] = -1
+        del document['title']
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.revalidate(document, ['/tags/2', '/sizes/l', '/title'], **schema)
+        assert exc_info.value.issues == {
+            'tags': validator.ERROR_MAX_LENGTH.format(2),
+            'sizes': {'l': validator.ERROR_MIN_VALUE.format(0)},
+            'title': validator.ERROR_REQUIRED_FIELD,
+        }
+
+    async def test_revalidate_patch(self, validator, schema):
+        document = {'title': 'hello', 'note': 'x', 'tags': ['a'], 'sizes': {}}
+
+        assert {'title': 'bye', 'note': '', 'tags': ['a'], 'sizes': {}} == await validator.revalidate(
+            document, [{'op': 'replace', 'path': '/title', 'value': 'bye'}, {'op': 'remove', 'path': '/note'}],
+            **schema)
+
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.revalidate(document, [
+                {'op': 'add', 'path': '/extra', 'value': 1},
+                {'op': 'replace', 'path': '/sizes', 'value': {'s': 'x'}},
+                {'op': 'add', 'path': '/tags/0', 'value': 1},
+            ], **schema)
+        assert exc_info.value.issues == {
+            'extra': validator.ERROR_UNKNOWN_FIELD,
+            'sizes': {'s': validator.ERROR_BAD_TYPE.format('integer')},
+            'tags': {0: validator.ERROR_BAD_TYPE.format('string')},
+        }
+
+        with pytest.raises(ValidationError):
+            await validator.revalidate(document, [{'op': 'remove', 'path': '/missing'}], **schema)
+
+    async def test_revalidate_patch_shifted_items(self, validator):
+        # The second insert shifts the first one, which is still validated.
+        schema = {'type': 'object', 'properties': {'items': {'type': 'array', 'items': {'type': 'integer'}}}}
+        with pytest.raises(ValidationError) as exc_info:
+            await validator.revalidate({'items': [1, 2]}, [
+                {'op': 'add', 'path': '/items/0', 'value': 'BAD'},
+                {'op': 'add', 'path': '/items/0', 'value': 0},
+            ], **schema)
+        assert exc_info.value.issues == {'items': {1: validator.ERROR_BAD_TYPE.format('integer')}}
+
+        document = await validator.revalidate({'items': ['BAD', 1]}, [
+            {'op': 'remove', 'path': '/items/0'},
+            {'op': 'add', 'path': '/items/-', 'value': 2},
+        ], **schema)
+        assert document == {'items': [1, 2]}
+
+    async def test_revalidate_strip_unknown(self, validator, schema):
+        document = {'title': 'hello', 'tags': [], 'sizes': {}}
+        assert {'title': 'hello', 'tags': [], 'sizes': {}} == await validator.revalidate(
+            document, [{'op': 'add', 'path': '/extra', 'value': 1}], **dict(schema, allow_unknown='strip'))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+from datetime import datetime
+from urllib.parse import parse_qs
+
+import pytest
+
+from aiovalidator import Validator, ValidationError
+from aiovalidator.query import QuerySchema
+
+
+class TestQuerySchema:
+
+    @pytest.fixture
+    def schema(self):
+        return QuerySchema({
+            'type': 'object',
+            'properties': {
+                'q': {'type': 'string', 'minlength': 2},
+                'page': {'type': 'integer', 'min': 1, 'required': False, 'default': 1},
+                'price': {'type': 'number', 'required': False},
+                'exact': {'type': 'boolean', 'required': False},
+                'since': {'type': 'datetime', 'format': '%Y-%m-%d', 'required': False},
+                'tag': {'type': 'array', 'items': {'type': 'integer'}, 'maxlength': 3, 'required': False},
+            }
+        })
+
+    def test_validate(self, schema):
+        query = parse_qs('q=shoes&price=-1.5e2&exact=TRUE&since=2018-01-02&tag=1&tag=2')
+        assert schema.validate(query) == {
+            'q': 'shoes',
+            'page': 1,
+            'price': -150.0,
+            'exact': True,
+            'since': datetime(2018, 1, 2),
+            'tag': [1, 2],
+        }
+
+    def test_validate_multidict(self, schema):
+        multidict = pytest.importorskip('multidict')
+        query = multidict.MultiDict([('q', 'shoes'), ('tag', '3'), ('page', '+2'), ('tag', '4')])
+        assert schema.validate(query) == {'q': 'shoes', 'page': 2, 'tag': [3, 4]}
+
+    def test_validate_errors(self, schema):
+        query = parse_qs('q=s&q=t&page=0&price=cheap&exact=1&tag=1&tag=x&sort=asc')
+        with pytest.raises(ValidationError) as exc_info:
+            schema.validate(query)
+        assert exc_info.value.issues == {
+            'q': QuerySchema.ERROR_MULTIPLE_VALUES,
+            'page': Validator.ERROR_MIN_VALUE.format(1),
+            'price': Validator.ERROR_BAD_TYPE.format('int or float'),
+            'exact': Validator.ERROR_BAD_TYPE.format('boolean'),
+            'tag': {1: Validator.ERROR_BAD_TYPE.format('integer')},
+            'sort': Validator.ERROR_UNKNOWN_FIELD,
+        }
+
+        with pytest.raises(ValidationError) as exc_info:
+            schema.validate({'tag': ['1', '2', '3', '4']})
+        assert exc_info.value.issues == {
+            'q': Validator.ERROR_REQUIRED_FIELD,
+            'tag': Validator.ERROR_MAX_LENGTH.format(3),
+        }
+
+    def test_validate_empty_and_unknown(self, schema):
+        # An empty list of values is missing.
+        assert schema.validate({'q': ['shoes'], 'page': [], 'tag': []}) == {'q': 'shoes', 'page': 1}
+
+        with pytest.raises(ValidationError) as exc_info:
+            schema.validate({'q': []})
+        assert exc_info.value.issues == {'q': Validator.ERROR_REQUIRED_FIELD}
+
+        # Unknown keys are reported in the query order.
+        keys = ['z{0}'.format(i) for i in range(20)]
+        with pytest.raises(ValidationError) as exc_info:
+            schema.validate(dict.fromkeys(['q'] + keys, ['shoes']))
+        assert [path for path, _ in exc_info.value.records] == [(key,) for key in keys]
+
+    def test_unsupported_type(self):
+        with pytest.raises(ValueError):
+            QuerySchema({'type': 'object', 'properties': {'filter': {'type': 'object'}}})
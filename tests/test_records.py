@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import pytest
+
+from aiovalidator import Record
+from aiovalidator.records import make_record_class
+
+
+class TestRecord:
+
+    @pytest.fixture
+    def record_class(self):
+        return make_record_class('Point', {'x': {'type': 'integer'}, 'y': {'type': 'integer', 'default': 0}})
+
+    def test_record(self, record_class):
+        point = record_class(x=1)
+        assert isinstance(point, Record)
+        assert (point.x, point.y) == (1, 0)
+        assert point == record_class.from_dict({'x': 1})
+        assert point.to_dict() == {'x': 1, 'y': 0}
+        assert repr(point) == 'Point(x=1, y=0)'
+        assert not hasattr(point, '__dict__')
+
+        with pytest.raises(TypeError):
+            record_class(z=1)
+
+    def test_record_nested_to_dict(self, record_class):
+        line_class = make_record_class('Line', {'points': {'type': 'array'}, 'start': {'type': 'object'}})
+        line = line_class(points=[record_class(x=1)], start=record_class(x=2, y=3))
+        assert line.to_dict() == {'points': [{'x': 1, 'y': 0}], 'start': {'x': 2, 'y': 3}}
+
+    def test_make_record_class_invalid_field(self):
+        with pytest.raises(ValueError):
+            make_record_class('Record', {'^x$': {'type': 'integer'}})
+
+        # Properties can not shadow the methods of the records.
+        for prop in ('to_dict', 'from_dict'):
+            with pytest.raises(ValueError):
+                make_record_class('Record', {prop: {'type': 'integer'}})
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aiovalidator import Validator, ValidationError, Schema
+
+
+class TestSchema:
+
+    @pytest.fixture
+    def schema(self):
+        return Validator().compile({
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer', 'min': 1},
+                'type': {'type': 'string', 'allowed': ['a', 'b']},
+                'tags': {'type': 'array', 'items': {'type': 'string'}, 'unique_indexes': [[]], 'required': False},
+            }
+        })
+
+    def test_compile(self, schema):
+        assert isinstance(schema, Schema)
+        assert schema.schema['properties']['type']['allowed'] == frozenset(('a', 'b'))
+
+        with pytest.raises(TypeError):
+            schema.schema['properties']['id']['min'] = 0
+
+        schema = Validator().compile({'type': 'string', 'allowed': ['a', 'b']}, optimize=False)
+        assert schema.schema['allowed'] == ('a', 'b')
+
+        with pytest.raises(ValueError):
+            Schema({'type': 'object', 'properties': {'id': {'type': 'unknown'}}})
+
+    async def test_compile_key_sets(self, schema):
+        # The key sets are computed when the schema is compiled, validation only reads them.
+        properties = schema.schema['properties']
+        assert id(properties) in schema.validator._object_key_sets
+        keys = schema.validator._object_keys(properties)
+        await schema.validate({'id': 1, 'type': 'a'})
+        assert schema.validator._object_keys(properties) is keys
+
+    async def test_validate(self, schema):
+        assert {'id': 1, 'type': 'a'} == await schema.validate({'id': 1, 'type': 'a'})
+        assert {'id': 1, 'type': 'a'} == schema.validate_sync({'id': 1, 'type': 'a'})
+
+        with pytest.raises(ValidationError) as exc_info:
+            schema.validate_sync({'id': 0, 'type': 'c', 'tags': ['x', 'x']})
+        assert exc_info.value.issues == {
+            'id': Validator.ERROR_MIN_VALUE.format(1),
+            'type': Validator.ERROR_UNALLOWED_VALUE.format('c'),
+            'tags': {1: Validator.ERROR_NOT_UNIQUE.format(0)},
+        }
+
+    def test_validate_sync_async_validator(self):
+        class CustomValidator(Validator):
+            async def validate_slow(self, value, **kwargs):
+                await asyncio.sleep(0)
+                return value
+
+        schema = CustomValidator().compile({'type': 'slow'})
+        with pytest.raises(RuntimeError):
+            schema.validate_sync(1)
+
+    def test_validate_record(self):
+        schema = Schema({'type': 'object', 'record': True, 'properties': {'id': {'type': 'integer'}}})
+        assert type(schema.validate_sync({'id': 1})) is type(schema.validate_sync({'id': 2}))
+
+    def test_validate_many(self, schema):
+        values = [{'id': i, 'type': 'a', 'tags': [str(i)]} for i in range(1, 1001)]
+        assert values == schema.validate_many(values, max_workers=4)
+
+        values[10] = {'id': 0, 'type': 'a'}
+        with pytest.raises(ValidationError):
+            schema.validate_many(values, max_workers=4)
+
+        results = schema.validate_many(values, max_workers=3, return_exceptions=True)
+        assert isinstance(results[10], ValidationError)
+        assert results[:10] == values[:10] and results[11:] == values[11:]
+
+    def test_validate_threads(self, schema):
+        # The same compiled schema is shared by all the threads.
+        def validate(i):
+            value = {'id': i, 'type': 'b', 'tags': ['x', 'y']}
+            return schema.validate_sync(value) == value
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert all(executor.map(validate, range(1, 2001)))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the `aiovalidator` package.
+# (c) 2016-2018 alldbx <welcome@alldbx.com>
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+"""
+:Authors:
+    - `Vladimir Kozlovsky <vladimir@alldbx.com>`_
+"""
+import pytest
+
+from aiovalidator import Validator
+
+web = pytest.importorskip('aiohttp.web')
+test_utils = pytest.importorskip('aiohttp.test_utils')
+validate_request = pytest.importorskip('aiovalidator.web').validate_request
+
+
+class TestValidateRequest:
+
+    @pytest.fixture
+    def app(self):
+        @validate_request(
+            match_info={'type': 'object', 'properties': {'id': {'type': 'integer', 'min': 1}}},
+            query={'type': 'object', 'properties': {'verbose': {'type': 'boolean', 'required': False}}},
+            body={'type': 'object', 'properties': {'title': {'type': 'string'}}},
+        )
+        async def handler(request):
+            return web.json_response({'id': request['match_info']['id'], 'query': request['query'],
+                                      'body': request['body']})
+
+        app = web.Application()
+        app.router.add_post('/items/{id}', handler)
+        return app
+
+    async def test_valid_request(self, app):
+        async with test_utils.TestClient(test_utils.TestServer(app)) as client:
+            response = await client.post('/items/5?verbose=true', json={'title': 'hello'})
+            assert response.status == 200
+            assert await response.json() == {'id': 5, 'query': {'verbose': True}, 'body': {'title': 'hello'}}
+
+    async def test_invalid_request(self, app):
+        async with test_utils.TestClient(test_utils.TestServer(app)) as client:
+            response = await client.post('/items/0?verbose=maybe&page=1', json={'title': 1})
+            assert response.status == 422
+            assert await response.json() == {
+                'error': Validator.ERROR_OBJECT_PROPERTIES,
+                'issues': {
+                    'match_info': {'id': Validator.ERROR_MIN_VALUE.format(1)},
+                    'query': {'verbose': Validator.ERROR_BAD_TYPE.format('boolean'),
+                              'page': Validator.ERROR_UNKNOWN_FIELD},
+                    'body': {'title': Validator.ERROR_BAD_TYPE.format('string')},
+                },
+            }
+
+            response = await client.post('/items/1', data=b'{"title": ')
+            assert response.status == 422
+            assert (await response.json())['issues'] == {'body': 'invalid JSON'}